@@ -23,9 +23,15 @@ from .core import (
     METADATA_FILE,
     COMMON_SKILL_DIRS,
     REQUIRED_SKILL_FIELDS,
+    DEFAULT_BRANCH_CACHE_TTL,
+
+    # Cache
+    get_cache_dir,
+    write_file_atomic,
 
     # Logging
     Colors,
+    init_colors,
     log_info,
     log_success,
     log_warning,
@@ -36,9 +42,16 @@ from .core import (
 
     # Git Operations
     run_git,
+    get_git_version,
     get_git_commit_hash,
     detect_default_branch,
+    list_github_skill_paths,
+    read_github_file,
+    get_object_cache_path,
+    update_object_cache,
     clone_repo,
+    clone_repo_shallow,
+    narrow_sparse_checkout,
 
     # Metadata
     write_skill_metadata,
@@ -46,6 +59,7 @@ from .core import (
 
     # Skill Discovery
     discover_skills,
+    is_ignored_skill_dir,
     find_skills_root,
     parse_skill_md,
 
@@ -53,10 +67,12 @@ from .core import (
     get_claude_skills_dir,
     backup_skill,
     install_skill,
+    remove_skill,
     pack_skill,
 
     # Validation
     validate_skill_md,
+    validate_skill_md_from_bytes,
 )
 
 from .cli import main
@@ -67,9 +83,15 @@ __all__ = [
     "METADATA_FILE",
     "COMMON_SKILL_DIRS",
     "REQUIRED_SKILL_FIELDS",
+    "DEFAULT_BRANCH_CACHE_TTL",
+
+    # Cache
+    "get_cache_dir",
+    "write_file_atomic",
 
     # Logging
     "Colors",
+    "init_colors",
     "log_info",
     "log_success",
     "log_warning",
@@ -80,9 +102,16 @@ __all__ = [
 
     # Git Operations
     "run_git",
+    "get_git_version",
     "get_git_commit_hash",
     "detect_default_branch",
+    "list_github_skill_paths",
+    "read_github_file",
+    "get_object_cache_path",
+    "update_object_cache",
     "clone_repo",
+    "clone_repo_shallow",
+    "narrow_sparse_checkout",
 
     # Metadata
     "write_skill_metadata",
@@ -90,6 +119,7 @@ __all__ = [
 
     # Skill Discovery
     "discover_skills",
+    "is_ignored_skill_dir",
     "find_skills_root",
     "parse_skill_md",
 
@@ -97,10 +127,12 @@ __all__ = [
     "get_claude_skills_dir",
     "backup_skill",
     "install_skill",
+    "remove_skill",
     "pack_skill",
 
     # Validation
     "validate_skill_md",
+    "validate_skill_md_from_bytes",
 
     # CLI
     "main",
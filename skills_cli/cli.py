@@ -6,18 +6,17 @@ Core logic is provided by the core module.
 """
 
 import argparse
-import json
 import os
-import shutil
-import subprocess
-import tempfile
+import sys
 from pathlib import Path
+from typing import Optional
 
 from . import __version__
 from .core import (
     DEFAULT_REPO,
     COMMON_SKILL_DIRS,
     Colors,
+    init_colors,
     log_info,
     log_success,
     log_warning,
@@ -26,15 +25,22 @@ from .core import (
     run_git,
     get_git_commit_hash,
     detect_default_branch,
-    clone_repo,
+    list_github_skill_paths,
+    read_github_file,
+    clone_repo_shallow,
+    narrow_sparse_checkout,
     read_skill_metadata,
     discover_skills,
+    is_ignored_skill_dir,
     find_skills_root,
     get_claude_skills_dir,
     backup_skill,
     install_skill,
+    remove_skill,
     pack_skill,
+    write_file_atomic,
     validate_skill_md,
+    validate_skill_md_from_bytes,
 )
 
 
@@ -50,6 +56,172 @@ def get_repo_from_args(args) -> str:
     return args.repo
 
 
+def validate_one(skill: dict) -> list[str]:
+    """Validate a discovered skill's SKILL.md (for use with map_parallel)."""
+    return validate_skill_md(skill["path"])
+
+
+class OutputBuffer:
+    """
+    Collects output lines and writes them with one sys.stdout.write().
+
+    Commands that print many lines in a row use this instead of a print()
+    per line (each print takes the stdout lock and may flush).
+    """
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts = []
+
+    def add(self, line: str = ""):
+        self.parts.append(line)
+        self.parts.append("\n")
+
+    def success(self, msg: str):
+        """Buffered log_success."""
+        self.add(f"{Colors.GREEN}✓{Colors.RESET} {msg}")
+
+    def warning(self, msg: str):
+        """Buffered log_warning."""
+        self.add(f"{Colors.YELLOW}⚠{Colors.RESET} {msg}")
+
+    def flush(self):
+        if self.parts:
+            sys.stdout.write("".join(self.parts))
+            self.parts.clear()
+
+
+# Default worker count for --jobs
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+
+
+def map_parallel(func, items: list, max_workers: int = DEFAULT_JOBS):
+    """
+    Apply func to each item on a thread pool, yielding results in input order.
+
+    Installing and packing skills is I/O-bound (copytree/zip release the GIL
+    during syscalls), so threads overlap the work. Falls back to a plain
+    loop when there is at most one item or one worker (which also keeps
+    tracebacks readable).
+    """
+    if len(items) <= 1 or max_workers <= 1:
+        yield from map(func, items)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        yield from executor.map(func, items)
+
+
+def scan_skills_dir(skills_dir: Path) -> Optional[tuple[dict, list[Path]]]:
+    """
+    Inspect a skills directory in a single pass (used by doctor).
+
+    One scandir lists the folders (hidden and vendored ones such as
+    .backup or node_modules are ignored via is_ignored_skill_dir, as in
+    discover_skills); each folder's SKILL.md is then read
+    once (in parallel) and validated from those bytes, which both
+    identifies skills and finds orphaned folders.
+
+    Returns:
+        None if the directory doesn't exist, else a tuple of
+        ({folder_name: issues} for skills, orphaned directories)
+    """
+    try:
+        with os.scandir(skills_dir) as it:
+            dirs = sorted(
+                (entry for entry in it if not is_ignored_skill_dir(entry.name) and entry.is_dir()),
+                key=lambda e: e.name.lower()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    def inspect(entry: os.DirEntry) -> Optional[list[str]]:
+        try:
+            with open(os.path.join(entry.path, "SKILL.md"), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            return [f"Cannot read SKILL.md: {e}"]
+        return validate_skill_md_from_bytes(content)
+
+    skills = {}
+    orphaned = []
+    for entry, issues in zip(dirs, map_parallel(inspect, dirs)):
+        if issues is not None:
+            skills[entry.name] = issues
+        else:
+            orphaned.append(Path(entry.path))
+    return skills, orphaned
+
+
+def filter_skills(skills: list[dict], selection: str) -> list[dict]:
+    """
+    Select skills by a comma-separated list of folder names or skill names.
+
+    Matching is case-insensitive (casefold). The selection is turned into
+    a set once, so each skill costs two set lookups.
+    """
+    requested = {name.strip().casefold() for name in selection.split(",")}
+    requested.discard("")
+    return [
+        s for s in skills
+        if s["folder_name"].casefold() in requested
+        or (s.get("name") and s["name"].casefold() in requested)
+    ]
+
+
+# Free space /dev/shm must have before throwaway clones are put there
+SCRATCH_MIN_FREE = 256 * 1024 * 1024
+
+
+def scratch_dir():
+    """
+    TemporaryDirectory for read-only throwaway clones (list/validate/pack).
+
+    On Linux, uses /dev/shm (tmpfs) when it is writable and has room, so
+    the clone never touches disk; an explicit TMPDIR is respected. Not
+    for install/sync, which move files out of the clone: those must stay
+    on a real filesystem so the move can be a rename.
+    """
+    import tempfile
+
+    shm = "/dev/shm"
+    if sys.platform.startswith("linux") and "TMPDIR" not in os.environ and os.access(shm, os.W_OK):
+        try:
+            st = os.statvfs(shm)
+            if st.f_bavail * st.f_frsize >= SCRATCH_MIN_FREE:
+                return tempfile.TemporaryDirectory(prefix="skills-cli-", dir=shm)
+        except OSError:
+            pass
+    return tempfile.TemporaryDirectory(prefix="skills-cli-")
+
+
+def skill_md_patterns(repo_info: dict) -> list[str]:
+    """Sparse-checkout patterns matching every SKILL.md under the repo's subdir."""
+    subdir = (repo_info["subdir"] or "").strip("/")
+    return [f"/{subdir}/**/SKILL.md"] if subdir else ["**/SKILL.md"]
+
+
+def make_skill_md_tree(repo_dir: Path, paths: list[str], contents: Optional[list[bytes]] = None):
+    """
+    Recreate a repo's SKILL.md layout from a remote file listing.
+
+    Lets find_skills_root pick the skills root exactly as it would for a
+    clone. Without contents the files are left empty (names fall back to
+    folder names).
+    """
+    for i, path in enumerate(paths):
+        skill_md = repo_dir / path
+        skill_md.parent.mkdir(parents=True, exist_ok=True)
+        if contents is None:
+            skill_md.touch()
+        else:
+            skill_md.write_bytes(contents[i])
+
+
 def prepare_repo_info(args) -> dict:
     """Prepare repo info, handling branch override and auto-detection."""
     repo_url = get_repo_from_args(args)
@@ -57,60 +229,103 @@ def prepare_repo_info(args) -> dict:
 
     if hasattr(args, 'branch') and args.branch:
         repo_info["branch"] = args.branch
-    elif repo_info["branch"] == "main" and "/tree/" not in repo_url:
+        repo_info["branch_explicit"] = True
+    elif not repo_info["branch_explicit"]:
         log_info("Auto-detecting default branch...")
         repo_info["branch"] = detect_default_branch(repo_info["clone_url"])
 
     return repo_info
 
 
+def display_name(skill: dict) -> str:
+    """Name to show for a skill: its frontmatter name, else its folder name."""
+    return skill.get("name") or skill["folder_name"]
+
+
 def format_skills_list(skills: list[dict], detailed: bool = False, show_source: bool = False) -> None:
     """Format and output skills list."""
+    names = [display_name(s) for s in skills]
+    out = OutputBuffer()
+
     if detailed:
-        name_width = max(len(s.get("name") or s["folder_name"]) for s in skills)
-        name_width = max(name_width, 4)
+        name_width = max([4, *map(len, names)])
+        indent = " " * name_width
+        if show_source:
+            sources = list(map_parallel(lambda s: read_skill_metadata(s.get("path")), skills))
+        else:
+            sources = [None] * len(skills)
 
-        print(f"\n  {'Name':<{name_width}}  Description")
-        print(f"  {'-' * name_width}  {'-' * 50}")
+        out.add(f"\n  {'Name':<{name_width}}  Description")
+        out.add(f"  {'-' * name_width}  {'-' * 50}")
 
-        for skill in skills:
-            name = skill.get("name") or skill["folder_name"]
+        # Row templates are built once; the loop only fills in values
+        row = f"  {Colors.CYAN}{{:<{name_width}}}{Colors.RESET}  {{}}".format
+        source_row = f"  {indent}  {Colors.YELLOW}↳ {{}} ({{}}@{{}}){Colors.RESET}".format
+
+        for name, skill, metadata in zip(names, skills, sources):
             desc = skill.get("description") or "-"
             if len(desc) > 60:
                 desc = desc[:57] + "..."
-            print(f"  {Colors.CYAN}{name:<{name_width}}{Colors.RESET}  {desc}")
-
-            if show_source:
-                metadata = read_skill_metadata(skill.get("path"))
-                if metadata:
-                    source = metadata.get("source_url", "-")
-                    branch = metadata.get("branch", "-")
-                    commit = metadata.get("commit", "-")
-                    if len(source) > 50:
-                        source = source[:47] + "..."
-                    print(f"  {' ' * name_width}  {Colors.YELLOW}↳ {source} ({branch}@{commit}){Colors.RESET}")
+            out.add(row(name, desc))
+
+            if metadata:
+                source = metadata.get("source_url", "-")
+                branch = metadata.get("branch", "-")
+                commit = metadata.get("commit", "-")
+                if len(source) > 50:
+                    source = source[:47] + "..."
+                out.add(source_row(source, branch, commit))
     else:
-        print()
-        for skill in skills:
-            name = skill.get("name") or skill["folder_name"]
-            print(f"  {Colors.CYAN}-{Colors.RESET} {name}")
+        out.add()
+        bullet = f"  {Colors.CYAN}-{Colors.RESET} "
+        for name in names:
+            out.add(bullet + name)
+
+    out.flush()
+
+
+def _parse_selection(selection: str, count: int) -> list[int]:
+    """
+    Parse a selection such as "1,3,5-7" into sorted, unique 0-based indices.
+
+    "all", "*" and the empty string select everything. Ranges are clamped
+    to 1..count before expanding (so "1-999999999" costs nothing extra)
+    and may be given in either order; out-of-range numbers are ignored.
+
+    Raises:
+        ValueError: if a part isn't a number or a range of numbers
+    """
+    selection = selection.strip().lower()
+    if selection in ("all", "*", ""):
+        return list(range(count))
+
+    selected = set()
+    for part in selection.split(","):
+        start, sep, end = part.partition("-")
+        first = int(start)
+        last = int(end) if sep else first
+        if first > last:
+            first, last = last, first
+        selected.update(range(max(first, 1) - 1, min(last, count)))
+    return sorted(selected)
 
 
 def interactive_select(skills: list[dict]) -> list[dict]:
     """Interactive skill selection interface."""
-    print(f"\n{Colors.BOLD}Available Skills:{Colors.RESET}\n")
+    out = OutputBuffer()
+    out.add(f"\n{Colors.BOLD}Available Skills:{Colors.RESET}\n")
 
     for i, skill in enumerate(skills, 1):
-        name = skill.get("name") or skill["folder_name"]
-        desc = skill.get("description", "No description")
-        print(f"  {Colors.CYAN}{i:3}{Colors.RESET}. {Colors.BOLD}{name}{Colors.RESET}")
-        print(f"       {Colors.YELLOW}{desc}{Colors.RESET}")
+        desc = skill.get("description") or "No description"
+        out.add(f"  {Colors.CYAN}{i:3}{Colors.RESET}. {Colors.BOLD}{display_name(skill)}{Colors.RESET}")
+        out.add(f"       {Colors.YELLOW}{desc}{Colors.RESET}")
 
-    print(f"\n{Colors.BOLD}Enter selection:{Colors.RESET}")
-    print("  - 'all' or '*' to install all")
-    print("  - Comma-separated numbers (e.g., 1,3,5)")
-    print("  - Range (e.g., 1-5)")
-    print("  - 'q' to quit\n")
+    out.add(f"\n{Colors.BOLD}Enter selection:{Colors.RESET}")
+    out.add("  - 'all' or '*' to install all")
+    out.add("  - Comma-separated numbers (e.g., 1,3,5)")
+    out.add("  - Range (e.g., 1-5)")
+    out.add("  - 'q' to quit\n")
+    out.flush()
 
     try:
         selection = input(f"{Colors.GREEN}>{Colors.RESET} ").strip().lower()
@@ -121,27 +336,13 @@ def interactive_select(skills: list[dict]) -> list[dict]:
     if selection in ("q", "quit", "exit"):
         return []
 
-    if selection in ("all", "*", ""):
-        return skills
-
-    selected = []
     try:
-        for part in selection.split(","):
-            part = part.strip()
-            if "-" in part:
-                start, end = map(int, part.split("-"))
-                for i in range(start, end + 1):
-                    if 1 <= i <= len(skills):
-                        selected.append(skills[i - 1])
-            else:
-                i = int(part)
-                if 1 <= i <= len(skills):
-                    selected.append(skills[i - 1])
+        indices = _parse_selection(selection, len(skills))
     except ValueError:
         log_error("Invalid selection format")
         return []
 
-    return selected
+    return [skills[i] for i in indices]
 
 
 # =============================================================================
@@ -150,11 +351,26 @@ def interactive_select(skills: list[dict]) -> list[dict]:
 
 def cmd_list(args):
     """list command: List available skills from a remote repo."""
+
     repo_info = prepare_repo_info(args)
 
-    with tempfile.TemporaryDirectory() as tmp:
+    # On GitHub no clone is needed: the file listing gives the skill
+    # locations, and --detail only needs the SKILL.md files themselves
+    skill_md_paths = list_github_skill_paths(repo_info)
+    contents = None
+    if skill_md_paths is not None and args.detail:
+        contents = list(map_parallel(lambda path: read_github_file(repo_info, path), skill_md_paths))
+        if None in contents:
+            skill_md_paths = None
+
+    with scratch_dir() as tmp:
         tmp_dir = Path(tmp) / "repo"
-        cloned_root = clone_repo(repo_info, tmp_dir)
+        if skill_md_paths is not None:
+            make_skill_md_tree(tmp_dir, skill_md_paths, contents)
+            subdir = repo_info["subdir"]
+            cloned_root = tmp_dir / subdir if subdir else tmp_dir
+        else:
+            cloned_root = clone_repo_shallow(repo_info, tmp_dir, skill_md_patterns(repo_info))
         skills_root, skills = find_skills_root(cloned_root)
 
         if not skills:
@@ -246,12 +462,7 @@ def cmd_remove(args):
         return 0
 
     if args.skills:
-        requested = set(s.strip().lower() for s in args.skills.split(","))
-        skills_to_remove = [
-            s for s in installed_skills
-            if s["folder_name"].lower() in requested
-            or (s.get("name") and s["name"].lower() in requested)
-        ]
+        skills_to_remove = filter_skills(installed_skills, args.skills)
 
         if not skills_to_remove:
             log_error(f"No matching skills found for: {args.skills}")
@@ -269,22 +480,23 @@ def cmd_remove(args):
     dry_run = getattr(args, 'dry_run', False)
 
     if dry_run:
-        print(f"\n{Colors.YELLOW}[DRY RUN] The following skills would be removed:{Colors.RESET}\n")
+        out = OutputBuffer()
+        out.add(f"\n{Colors.YELLOW}[DRY RUN] The following skills would be removed:{Colors.RESET}\n")
         for skill in skills_to_remove:
-            skill_name = skill.get("name") or skill["folder_name"]
-            skill_path = skill["path"]
-            print(f"  {Colors.RED}-{Colors.RESET} {skill_name}")
-            print(f"    {Colors.YELLOW}Path: {skill_path}{Colors.RESET}")
-        print()
+            out.add(f"  {Colors.RED}-{Colors.RESET} {display_name(skill)}")
+            out.add(f"    {Colors.YELLOW}Path: {skill['path']}{Colors.RESET}")
+        out.add()
+        out.flush()
         log_info(f"[DRY RUN] Would remove {len(skills_to_remove)} skills")
         return 0
 
     if not args.force:
-        names = [s.get("name") or s["folder_name"] for s in skills_to_remove]
-        print(f"\n{Colors.YELLOW}The following skills will be removed:{Colors.RESET}")
-        for name in names:
-            print(f"  {Colors.RED}-{Colors.RESET} {name}")
-        print()
+        out = OutputBuffer()
+        out.add(f"\n{Colors.YELLOW}The following skills will be removed:{Colors.RESET}")
+        for skill in skills_to_remove:
+            out.add(f"  {Colors.RED}-{Colors.RESET} {display_name(skill)}")
+        out.add()
+        out.flush()
 
         try:
             confirm = input(f"{Colors.BOLD}Confirm removal? [y/N]{Colors.RESET} ").strip().lower()
@@ -296,24 +508,40 @@ def cmd_remove(args):
             log_info("Cancelled")
             return 0
 
-    removed = 0
-    for skill in skills_to_remove:
-        skill_path = skill["path"]
-        skill_name = skill.get("name") or skill["folder_name"]
+    def remove_one(skill: dict) -> Optional[Exception]:
         try:
-            shutil.rmtree(skill_path)
-            log_success(f"Removed: {skill_name}")
-            removed += 1
+            remove_skill(skill["path"])
         except Exception as e:
-            log_error(f"Failed to remove {skill_name}: {e}")
+            return e
+        return None
+
+    # Never hand the same directory to two workers
+    skills_to_remove = list({s["path"]: s for s in skills_to_remove}.values())
+
+    removed = 0
+    out = OutputBuffer()
+    results = map_parallel(remove_one, skills_to_remove)
+    for skill, error in zip(skills_to_remove, results):
+        skill_name = display_name(skill)
+        if error is None:
+            out.success(f"Removed: {skill_name}")
+            removed += 1
+        else:
+            # Errors go to stderr: flush first to keep the order
+            out.flush()
+            log_error(f"Failed to remove {skill_name}: {error}")
 
-    print()
-    log_success(f"Removed {removed}/{len(skills_to_remove)} skills")
+    out.add()
+    out.success(f"Removed {removed}/{len(skills_to_remove)} skills")
+    out.flush()
     return 0
 
 
 def cmd_install(args):
     """install command: Install skills from a remote repo to local."""
+    import tempfile
+    import time
+
     repo_info = prepare_repo_info(args)
 
     if args.project:
@@ -328,7 +556,7 @@ def cmd_install(args):
 
     with tempfile.TemporaryDirectory() as tmp:
         tmp_dir = Path(tmp) / "repo"
-        cloned_root = clone_repo(repo_info, tmp_dir)
+        cloned_root = clone_repo_shallow(repo_info, tmp_dir, skill_md_patterns(repo_info))
         skills_root, all_skills = find_skills_root(cloned_root)
 
         if not all_skills:
@@ -336,12 +564,7 @@ def cmd_install(args):
             return 1
 
         if args.skills:
-            requested = set(s.strip().lower() for s in args.skills.split(","))
-            skills_to_install = [
-                s for s in all_skills
-                if s["folder_name"].lower() in requested
-                or (s.get("name") and s["name"].lower() in requested)
-            ]
+            skills_to_install = filter_skills(all_skills, args.skills)
 
             if not skills_to_install:
                 log_error(f"No matching skills found for: {args.skills}")
@@ -356,39 +579,62 @@ def cmd_install(args):
             log_info("No skills selected")
             return 0
 
+        # Installs run concurrently and land in target_dir/<folder name>:
+        # never hand two workers the same destination
+        skills_to_install = list({s["path"].name: s for s in skills_to_install}.values())
+
         commit_hash = get_git_commit_hash(tmp_dir)
 
         dry_run = getattr(args, 'dry_run', False)
         backup = getattr(args, 'backup', False)
 
+        out = OutputBuffer()
         if dry_run:
-            print(f"\n{Colors.YELLOW}[DRY RUN] The following actions would be performed:{Colors.RESET}\n")
+            out.add(f"\n{Colors.YELLOW}[DRY RUN] The following actions would be performed:{Colors.RESET}\n")
 
         if not dry_run:
             target_dir.mkdir(parents=True, exist_ok=True)
+            # Only SKILL.md files are checked out so far: fetch the rest of
+            # the selected skills (and nothing else)
+            narrow_sparse_checkout(tmp_dir, [s["path"] for s in skills_to_install])
+
+        # One timestamp for the whole batch
+        installed_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        def install_one(skill: dict) -> tuple[bool, str]:
+            # Report failures per skill: an exception escaping map_parallel
+            # would drop the buffered results of skills already installed
+            try:
+                return install_skill(
+                    skill["path"],
+                    target_dir,
+                    repo_info=repo_info,
+                    commit_hash=commit_hash,
+                    force=args.force,
+                    backup=backup,
+                    dry_run=dry_run,
+                    move=True,
+                    skip_unchanged=True,
+                    installed_at=installed_at
+                )
+            except OSError as e:
+                return (False, str(e))
 
         installed = 0
-        for skill in skills_to_install:
-            skill_name = skill.get("name") or skill["folder_name"]
-            success, message = install_skill(
-                skill["path"],
-                target_dir,
-                repo_info=repo_info,
-                commit_hash=commit_hash,
-                force=args.force,
-                backup=backup,
-                dry_run=dry_run
-            )
+        results = map_parallel(install_one, skills_to_install, args.jobs)
+        for skill, (success, message) in zip(skills_to_install, results):
+            skill_name = display_name(skill)
             if success:
                 if dry_run:
-                    print(f"  {Colors.CYAN}-{Colors.RESET} {skill_name}: {message}")
+                    out.add(f"  {Colors.CYAN}-{Colors.RESET} {skill_name}: {message}")
                 else:
-                    log_success(f"{skill_name}: {message}")
+                    out.success(f"{skill_name}: {message}")
                 installed += 1
             else:
-                log_warning(f"{skill_name}: {message}")
+                out.warning(f"{skill_name}: {message}")
 
-        print()
+        out.add()
+        out.flush()
         if dry_run:
             log_info(f"[DRY RUN] Would install {installed}/{len(skills_to_install)} skills to {target_dir}")
         else:
@@ -398,12 +644,14 @@ def cmd_install(args):
 
 def cmd_pack(args):
     """pack command: Pack skills into zip files."""
+    import json
+
     repo_info = prepare_repo_info(args)
     output_dir = Path(args.output)
 
-    with tempfile.TemporaryDirectory() as tmp:
+    with scratch_dir() as tmp:
         tmp_dir = Path(tmp) / "repo"
-        cloned_root = clone_repo(repo_info, tmp_dir)
+        cloned_root = clone_repo_shallow(repo_info, tmp_dir, skill_md_patterns(repo_info))
         skills_root, all_skills = find_skills_root(cloned_root)
 
         if not all_skills:
@@ -411,12 +659,7 @@ def cmd_pack(args):
             return 1
 
         if args.skills:
-            requested = set(s.strip().lower() for s in args.skills.split(","))
-            skills_to_pack = [
-                s for s in all_skills
-                if s["folder_name"].lower() in requested
-                or (s.get("name") and s["name"].lower() in requested)
-            ]
+            skills_to_pack = filter_skills(all_skills, args.skills)
         else:
             skills_to_pack = all_skills
 
@@ -425,9 +668,12 @@ def cmd_pack(args):
             return 1
 
         log_info(f"Packing {len(skills_to_pack)} skills to {output_dir}")
+        narrow_sparse_checkout(tmp_dir, [s["path"] for s in skills_to_pack])
 
-        for skill in skills_to_pack:
-            pack_skill(skill["path"], output_dir)
+        def pack_one(skill: dict) -> Path:
+            return pack_skill(skill["path"], output_dir)
+
+        list(map_parallel(pack_one, skills_to_pack, args.jobs))
 
         print()
         log_success(f"Packed {len(skills_to_pack)} skills")
@@ -435,7 +681,7 @@ def cmd_pack(args):
         manifest = {
             "skills": [
                 {
-                    "name": s.get("name") or s["folder_name"],
+                    "name": display_name(s),
                     "folder": s["folder_name"],
                     "description": s.get("description"),
                     "zip": f"{s['folder_name']}.zip"
@@ -444,7 +690,7 @@ def cmd_pack(args):
             ]
         }
         manifest_path = output_dir / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        write_file_atomic(manifest_path, json.dumps(manifest, indent=2).encode())
         log_success(f"Generated manifest: {manifest_path}")
 
         return 0
@@ -452,6 +698,9 @@ def cmd_pack(args):
 
 def cmd_sync(args):
     """sync command: Sync skills from a remote repo."""
+    import subprocess
+    import tempfile
+
     repo_info = prepare_repo_info(args)
 
     if args.project:
@@ -467,64 +716,71 @@ def cmd_sync(args):
     if git_dir.exists():
         log_info(f"Updating existing skills in {target_dir}")
         try:
-            run_git(["pull", "--rebase"], cwd=target_dir)
+            # The checkout is read-only from our side: a shallow fetch plus a
+            # reset skips the history download and rebase machinery of
+            # `pull --rebase`. --keep (unlike --hard) refuses to clobber
+            # local edits, and untracked files are left alone.
+            run_git(["fetch", "--quiet", "--depth=1", "origin"], cwd=target_dir)
+            run_git(["reset", "--quiet", "--keep", "@{upstream}"], cwd=target_dir)
             log_success("Skills updated successfully")
         except subprocess.CalledProcessError:
             log_error("Failed to update. Try removing and reinstalling.")
             return 1
+        _, skills = find_skills_root(target_dir)
     else:
         log_info(f"Cloning skills to {target_dir}")
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        clone_url = repo_info["clone_url"]
-        branch = repo_info["branch"]
-        subdir = repo_info["subdir"]
-
-        if subdir:
-            with tempfile.TemporaryDirectory() as tmp:
-                tmp_dir = Path(tmp) / "repo"
-                cloned_root = clone_repo(repo_info, tmp_dir)
-                skills_root, skills = find_skills_root(cloned_root)
-
-                for skill in skills:
-                    skill_path = skill["path"]
-                    dest = target_dir / skill_path.name
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    shutil.copytree(skill_path, dest)
-                    log_success(f"Synced: {skill_path.name}")
-        else:
-            with tempfile.TemporaryDirectory() as tmp:
-                tmp_dir = Path(tmp) / "repo"
-                run_git([
-                    "clone",
-                    "--depth=1",
-                    "--branch", branch,
-                    clone_url,
-                    str(tmp_dir)
-                ])
-                skills_root, skills = find_skills_root(tmp_dir)
-
-                if skills:
-                    for skill in skills:
-                        skill_path = skill["path"]
-                        dest = target_dir / skill_path.name
-                        if dest.exists():
-                            shutil.rmtree(dest)
-                        shutil.copytree(skill_path, dest)
-                        log_success(f"Synced: {skill_path.name}")
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp) / "repo"
+            cloned_root = clone_repo_shallow(repo_info, tmp_dir, skill_md_patterns(repo_info))
+            skills_root, skills = find_skills_root(cloned_root)
+
+            if not skills:
+                log_warning("No skills found in repository")
+                return 1
+
+            # Skills run concurrently and land in target_dir/<folder name>:
+            # never hand two workers the same destination (the last one
+            # wins, as it would in a serial loop)
+            skills = list({s["path"].name: s for s in skills}.values())
+
+            # Only SKILL.md files are checked out so far: fetch the rest of
+            # the skill folders (and nothing else)
+            narrow_sparse_checkout(tmp_dir, [s["path"] for s in skills])
+
+            def sync_one(skill: dict) -> tuple[bool, str]:
+                # One failing skill must not abort the others mid-sync
+                try:
+                    # The temp clone is discarded: move instead of copying
+                    return install_skill(skill["path"], target_dir, force=True, move=True)
+                except OSError as e:
+                    return (False, str(e))
+
+            out = OutputBuffer()
+            synced = []
+            results = map_parallel(sync_one, skills, args.jobs)
+            for skill, (success, message) in zip(skills, results):
+                if success:
+                    out.success(f"Synced: {skill['path'].name}")
+                    synced.append(skill)
                 else:
-                    log_warning("No skills found in repository")
-                    return 1
+                    out.warning(f"{skill['path'].name}: {message}")
+            out.flush()
 
+        if len(synced) < len(skills):
+            log_error(f"Synced {len(synced)}/{len(skills)} skills to {target_dir}")
+            return 1
         log_success(f"Skills synced to {target_dir}")
 
-    _, skills = find_skills_root(target_dir)
+    # After a fresh clone, `skills` already lists what was synced into
+    # target_dir: no need to walk it again
     if skills:
-        print(f"\n{Colors.BOLD}Installed skills:{Colors.RESET}")
+        out = OutputBuffer()
+        out.add(f"\n{Colors.BOLD}Installed skills:{Colors.RESET}")
         for skill in skills:
-            name = skill.get("name") or skill["folder_name"]
-            print(f"  {Colors.CYAN}-{Colors.RESET} {name}")
+            out.add(f"  {Colors.CYAN}-{Colors.RESET} {display_name(skill)}")
+        out.flush()
 
     return 0
 
@@ -538,22 +794,24 @@ def cmd_validate(args):
             log_warning("No skills to validate")
             return 1
 
-        print(f"\n{Colors.BOLD}Validating {len(skills_to_validate)} skills...{Colors.RESET}\n")
+        out = OutputBuffer()
+        out.add(f"\n{Colors.BOLD}Validating {len(skills_to_validate)} skills...{Colors.RESET}\n")
 
         total_issues = 0
-        for skill in skills_to_validate:
-            skill_name = skill.get("name") or skill["folder_name"]
-            issues = validate_skill_md(skill["path"])
+        results = map_parallel(validate_one, skills_to_validate)
+        for skill, issues in zip(skills_to_validate, results):
+            skill_name = display_name(skill)
 
             if issues:
-                print(f"  {Colors.RED}✗{Colors.RESET} {Colors.BOLD}{skill_name}{Colors.RESET}")
+                out.add(f"  {Colors.RED}✗{Colors.RESET} {Colors.BOLD}{skill_name}{Colors.RESET}")
                 for issue in issues:
-                    print(f"    {Colors.YELLOW}-{Colors.RESET} {issue}")
+                    out.add(f"    {Colors.YELLOW}-{Colors.RESET} {issue}")
                 total_issues += len(issues)
             else:
-                print(f"  {Colors.GREEN}✓{Colors.RESET} {skill_name}")
+                out.add(f"  {Colors.GREEN}✓{Colors.RESET} {skill_name}")
 
-        print()
+        out.add()
+        out.flush()
         if total_issues > 0:
             log_warning(f"Found {total_issues} issues in {len(skills_to_validate)} skills")
             return 1
@@ -572,9 +830,9 @@ def cmd_validate(args):
     elif args.repo:
         # Validate from remote repo: must complete validation while temp directory exists
         repo_info = prepare_repo_info(args)
-        with tempfile.TemporaryDirectory() as tmp:
+        with scratch_dir() as tmp:
             tmp_dir = Path(tmp) / "repo"
-            cloned_root = clone_repo(repo_info, tmp_dir)
+            cloned_root = clone_repo_shallow(repo_info, tmp_dir, skill_md_patterns(repo_info))
             skills_root, skills_to_validate = find_skills_root(cloned_root)
             return do_validate(skills_to_validate)
 
@@ -592,163 +850,126 @@ def cmd_doctor(args):
     """doctor command: Diagnose skills directory structure."""
     issues = []
     warnings = []
+    orphaned = []
+    out = OutputBuffer()
 
-    print(f"\n{Colors.BOLD}Skills CLI Doctor{Colors.RESET}\n")
+    out.add(f"\n{Colors.BOLD}Skills CLI Doctor{Colors.RESET}\n")
 
     global_dir = get_claude_skills_dir("personal")
-    print(f"  {Colors.CYAN}Global skills:{Colors.RESET} {global_dir}")
-    if global_dir.exists():
-        global_skills = discover_skills(global_dir)
-        print(f"    {Colors.GREEN}✓{Colors.RESET} Directory exists ({len(global_skills)} skills)")
-
-        for skill in global_skills:
-            skill_issues = validate_skill_md(skill["path"])
+    out.add(f"  {Colors.CYAN}Global skills:{Colors.RESET} {global_dir}")
+    scan = scan_skills_dir(global_dir)
+    if scan is not None:
+        global_skills, global_orphaned = scan
+        orphaned.extend(global_orphaned)
+        out.add(f"    {Colors.GREEN}✓{Colors.RESET} Directory exists ({len(global_skills)} skills)")
+
+        for folder_name, skill_issues in global_skills.items():
             if skill_issues:
-                warnings.append(f"Global skill '{skill['folder_name']}' has issues")
+                warnings.append(f"Global skill '{folder_name}' has issues")
     else:
-        print(f"    {Colors.YELLOW}⚠{Colors.RESET} Directory does not exist")
+        out.add(f"    {Colors.YELLOW}⚠{Colors.RESET} Directory does not exist")
+    out.flush()
 
     project_dir = get_claude_skills_dir("project")
-    print(f"\n  {Colors.CYAN}Project skills:{Colors.RESET} {project_dir}")
-    if project_dir.exists():
-        project_skills = discover_skills(project_dir)
-        print(f"    {Colors.GREEN}✓{Colors.RESET} Directory exists ({len(project_skills)} skills)")
-
-        for skill in project_skills:
-            skill_issues = validate_skill_md(skill["path"])
+    out.add(f"\n  {Colors.CYAN}Project skills:{Colors.RESET} {project_dir}")
+    scan = scan_skills_dir(project_dir)
+    if scan is not None:
+        project_skills, project_orphaned = scan
+        orphaned.extend(project_orphaned)
+        out.add(f"    {Colors.GREEN}✓{Colors.RESET} Directory exists ({len(project_skills)} skills)")
+
+        for folder_name, skill_issues in project_skills.items():
             if skill_issues:
-                warnings.append(f"Project skill '{skill['folder_name']}' has issues")
+                warnings.append(f"Project skill '{folder_name}' has issues")
     else:
-        print(f"    {Colors.YELLOW}○{Colors.RESET} Directory does not exist (this is normal)")
+        out.add(f"    {Colors.YELLOW}○{Colors.RESET} Directory does not exist (this is normal)")
+    out.flush()
 
-    print(f"\n  {Colors.CYAN}Checking for orphaned directories...{Colors.RESET}")
-    orphaned = []
-    for skills_dir in [global_dir, project_dir]:
-        if skills_dir.exists():
-            for item in skills_dir.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    skill_md = item / "SKILL.md"
-                    if not skill_md.exists():
-                        orphaned.append(item)
-                        issues.append(f"Orphaned directory (no SKILL.md): {item}")
+    # Orphans were collected by the scans above
+    out.add(f"\n  {Colors.CYAN}Checking for orphaned directories...{Colors.RESET}")
+    for item in orphaned:
+        issues.append(f"Orphaned directory (no SKILL.md): {item}")
 
     if orphaned:
         for item in orphaned:
-            print(f"    {Colors.RED}✗{Colors.RESET} {item.name} (no SKILL.md)")
+            out.add(f"    {Colors.RED}✗{Colors.RESET} {item.name} (no SKILL.md)")
     else:
-        print(f"    {Colors.GREEN}✓{Colors.RESET} No orphaned directories")
+        out.add(f"    {Colors.GREEN}✓{Colors.RESET} No orphaned directories")
+
+    out.flush()
 
-    print(f"\n  {Colors.CYAN}Checking for backup directories...{Colors.RESET}")
+    out.add(f"\n  {Colors.CYAN}Checking for backup directories...{Colors.RESET}")
     backup_dirs = []
     for skills_dir in [global_dir, project_dir]:
         backup_dir = skills_dir / ".backup"
-        if backup_dir.exists():
-            backup_count = len(list(backup_dir.iterdir()))
-            backup_dirs.append((backup_dir, backup_count))
-            print(f"    {Colors.YELLOW}○{Colors.RESET} {backup_dir} ({backup_count} backups)")
+        # Count entries straight off scandir: no exists() probe, no Path objects
+        try:
+            with os.scandir(backup_dir) as it:
+                backup_count = sum(1 for _ in it)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        backup_dirs.append((backup_dir, backup_count))
+        out.add(f"    {Colors.YELLOW}○{Colors.RESET} {backup_dir} ({backup_count} backups)")
 
     if not backup_dirs:
-        print(f"    {Colors.GREEN}✓{Colors.RESET} No backup directories")
+        out.add(f"    {Colors.GREEN}✓{Colors.RESET} No backup directories")
 
-    print(f"\n{Colors.BOLD}Summary:{Colors.RESET}")
+    out.add(f"\n{Colors.BOLD}Summary:{Colors.RESET}")
     if issues:
-        print(f"  {Colors.RED}✗{Colors.RESET} {len(issues)} issues found")
+        out.add(f"  {Colors.RED}✗{Colors.RESET} {len(issues)} issues found")
         for issue in issues:
-            print(f"    - {issue}")
+            out.add(f"    - {issue}")
     else:
-        print(f"  {Colors.GREEN}✓{Colors.RESET} No issues found")
+        out.add(f"  {Colors.GREEN}✓{Colors.RESET} No issues found")
 
     if warnings:
-        print(f"  {Colors.YELLOW}⚠{Colors.RESET} {len(warnings)} warnings")
+        out.add(f"  {Colors.YELLOW}⚠{Colors.RESET} {len(warnings)} warnings")
         for warning in warnings:
-            print(f"    - {warning}")
+            out.add(f"    - {warning}")
 
-    print()
+    out.add()
+    out.flush()
     return 1 if issues else 0
 
 
 # =============================================================================
-# Main Entry Point
+# Argument Definitions
 # =============================================================================
 
-def main():
-    """CLI program entry point."""
-    parser = argparse.ArgumentParser(
-        prog="skills-cli",
-        description="Cross-platform CLI for managing Claude Code skills",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List skills from official Anthropic repo (default)
-  skills-cli list
-  skills-cli list --detail
-
-  # List installed skills (shows global + project)
-  skills-cli installed --detail
-
-  # Install with safety options
-  skills-cli install --all --dry-run        # preview what would be installed
-  skills-cli install --all --backup         # backup before overwriting
-  skills-cli install --skills pdf,xlsx
-
-  # Remove skills
-  skills-cli remove --skills pdf --dry-run  # preview removal
-  skills-cli remove --all --force           # skip confirmation
-
-  # Pack skills for Claude Desktop
-  skills-cli pack --output dist/desktop
-
-  # Validate and diagnose
-  skills-cli validate                       # check installed skills
-  skills-cli validate --repo <url>          # check remote repo
-  skills-cli doctor                         # diagnose directory issues
-
-  # Sync skills from repository
-  skills-cli sync
-
-  # Use custom repository (URL can be positional or with --repo flag)
-  skills-cli list https://github.com/user/my-skills
-  skills-cli list https://github.com/user/dotfiles/tree/master/claude
-  skills-cli install https://github.com/user/my-skills --all
-  skills-cli install https://github.com/user/dotfiles/tree/master/claude -a
-
-  # Alternative: use --repo flag
-  skills-cli list --repo https://github.com/user/my-skills --branch develop
-  skills-cli install --repo https://github.com/user/my-skills --skills skill1,skill2
-"""
-    )
-
-    parser.add_argument(
-        "-v", "--version",
-        action="version",
-        version=f"%(prog)s {__version__}"
-    )
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # List command
-    list_parser = subparsers.add_parser("list", help="List available skills from a repository")
+def add_list_arguments(list_parser: argparse.ArgumentParser):
+    """Arguments for the list command."""
     list_parser.add_argument("repo_url", nargs="?", default=None,
                              help="Repository URL (positional, e.g., https://github.com/user/repo)")
     list_parser.add_argument("--repo", "-r", default=DEFAULT_REPO,
                              help=f"Repository URL (default: Anthropic official)")
-    list_parser.add_argument("--branch", "-b", help="Git branch (default: auto-detect or main)")
+    list_parser.add_argument("--branch", "-b",
+                             help="Git branch or full commit SHA (default: auto-detect or main)")
     list_parser.add_argument("--detail", "-d", action="store_true",
                              help="Show detailed info (name and description)")
-    list_parser.set_defaults(func=cmd_list)
 
-    # Installed command
-    installed_parser = subparsers.add_parser("installed", help="List installed skills")
+
+def add_installed_arguments(installed_parser: argparse.ArgumentParser):
+    """Arguments for the installed command."""
     installed_parser.add_argument("--project", "-p", action="store_true",
                                   help="Show project skills (.claude/skills/)")
     installed_parser.add_argument("--target", "-t", help="Custom skills directory")
     installed_parser.add_argument("--detail", "-d", action="store_true",
                                   help="Show detailed info (name and description)")
-    installed_parser.set_defaults(func=cmd_installed)
 
-    # Remove command
-    remove_parser = subparsers.add_parser("remove", aliases=["uninstall"],
-                                          help="Remove installed skills")
+
+def add_remove_arguments(remove_parser: argparse.ArgumentParser):
+    """Arguments for the remove command."""
     remove_parser.add_argument("--skills", "-s", help="Comma-separated list of skills to remove")
     remove_parser.add_argument("--all", "-a", action="store_true", help="Remove all skills")
     remove_parser.add_argument("--project", "-p", action="store_true",
@@ -758,15 +979,16 @@ Examples:
                                help="Skip confirmation prompt")
     remove_parser.add_argument("--dry-run", action="store_true",
                                help="Show what would be removed without actually removing")
-    remove_parser.set_defaults(func=cmd_remove)
 
-    # Install command
-    install_parser = subparsers.add_parser("install", help="Install skills from a repository")
+
+def add_install_arguments(install_parser: argparse.ArgumentParser):
+    """Arguments for the install command."""
     install_parser.add_argument("repo_url", nargs="?", default=None,
                                 help="Repository URL (positional, e.g., https://github.com/user/repo)")
     install_parser.add_argument("--repo", "-r", default=DEFAULT_REPO,
                                 help=f"Repository URL (default: Anthropic official)")
-    install_parser.add_argument("--branch", "-b", help="Git branch (default: auto-detect or main)")
+    install_parser.add_argument("--branch", "-b",
+                                help="Git branch or full commit SHA (default: auto-detect or main)")
     install_parser.add_argument("--skills", "-s", help="Comma-separated list of skills to install")
     install_parser.add_argument("--all", "-a", action="store_true", help="Install all skills")
     install_parser.add_argument("--project", "-p", action="store_true",
@@ -777,21 +999,26 @@ Examples:
                                 help="Backup existing skills before overwriting")
     install_parser.add_argument("--dry-run", action="store_true",
                                 help="Show what would be installed without actually installing")
-    install_parser.set_defaults(func=cmd_install)
+    install_parser.add_argument("--jobs", "-j", type=positive_int, default=DEFAULT_JOBS,
+                                help=f"Number of skills to install in parallel (default: {DEFAULT_JOBS})")
 
-    # Pack command
-    pack_parser = subparsers.add_parser("pack", help="Pack skills into zip files for Claude Desktop")
+
+def add_pack_arguments(pack_parser: argparse.ArgumentParser):
+    """Arguments for the pack command."""
     pack_parser.add_argument("repo_url", nargs="?", default=None,
                              help="Repository URL (positional, e.g., https://github.com/user/repo)")
     pack_parser.add_argument("--repo", "-r", default=DEFAULT_REPO,
                              help=f"Repository URL (default: Anthropic official)")
-    pack_parser.add_argument("--branch", "-b", help="Git branch (default: auto-detect or main)")
+    pack_parser.add_argument("--branch", "-b",
+                             help="Git branch or full commit SHA (default: auto-detect or main)")
     pack_parser.add_argument("--skills", "-s", help="Comma-separated list of skills to pack")
     pack_parser.add_argument("--output", "-o", default="dist/desktop", help="Output directory")
-    pack_parser.set_defaults(func=cmd_pack)
+    pack_parser.add_argument("--jobs", "-j", type=positive_int, default=DEFAULT_JOBS,
+                             help=f"Number of skills to pack in parallel (default: {DEFAULT_JOBS})")
+
 
-    # Sync command
-    sync_parser = subparsers.add_parser("sync", help="Sync skills from a repository")
+def add_sync_arguments(sync_parser: argparse.ArgumentParser):
+    """Arguments for the sync command."""
     sync_parser.add_argument("repo_url", nargs="?", default=None,
                              help="Repository URL (positional, e.g., https://github.com/user/repo)")
     sync_parser.add_argument("--repo", "-r", default=DEFAULT_REPO,
@@ -800,20 +1027,105 @@ Examples:
     sync_parser.add_argument("--project", "-p", action="store_true",
                              help="Sync to project .claude/skills/")
     sync_parser.add_argument("--target", "-t", help="Custom target directory")
-    sync_parser.set_defaults(func=cmd_sync)
+    sync_parser.add_argument("--jobs", "-j", type=positive_int, default=DEFAULT_JOBS,
+                             help=f"Number of skills to sync in parallel (default: {DEFAULT_JOBS})")
+
 
-    # Validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate SKILL.md format")
+def add_validate_arguments(validate_parser: argparse.ArgumentParser):
+    """Arguments for the validate command."""
     validate_parser.add_argument("--path", help="Path to skill directory or SKILL.md file")
     validate_parser.add_argument("--repo", "-r", help="Validate skills from a repository")
     validate_parser.add_argument("--branch", "-b", help="Git branch for --repo")
     validate_parser.add_argument("--project", "-p", action="store_true",
                                  help="Validate project skills")
-    validate_parser.set_defaults(func=cmd_validate)
 
-    # Doctor command
-    doctor_parser = subparsers.add_parser("doctor", help="Diagnose skills directory issues")
-    doctor_parser.set_defaults(func=cmd_doctor)
+
+# Subcommands: name -> (help, aliases, argument setup, handler)
+COMMANDS = {
+    "list": ("List available skills from a repository", (), add_list_arguments, cmd_list),
+    "installed": ("List installed skills", (), add_installed_arguments, cmd_installed),
+    "remove": ("Remove installed skills", ("uninstall",), add_remove_arguments, cmd_remove),
+    "install": ("Install skills from a repository", (), add_install_arguments, cmd_install),
+    "pack": ("Pack skills into zip files for Claude Desktop", (), add_pack_arguments, cmd_pack),
+    "sync": ("Sync skills from a repository", (), add_sync_arguments, cmd_sync),
+    "validate": ("Validate SKILL.md format", (), add_validate_arguments, cmd_validate),
+    "doctor": ("Diagnose skills directory issues", (), None, cmd_doctor),
+}
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    """CLI program entry point."""
+    parser = argparse.ArgumentParser(
+        prog="skills-cli",
+        description="Cross-platform CLI for managing Claude Code skills",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # List skills from official Anthropic repo (default)
+  skills-cli list
+  skills-cli list --detail
+
+  # List installed skills (shows global + project)
+  skills-cli installed --detail
+
+  # Install with safety options
+  skills-cli install --all --dry-run        # preview what would be installed
+  skills-cli install --all --backup         # backup before overwriting
+  skills-cli install --skills pdf,xlsx
+
+  # Remove skills
+  skills-cli remove --skills pdf --dry-run  # preview removal
+  skills-cli remove --all --force           # skip confirmation
+
+  # Pack skills for Claude Desktop
+  skills-cli pack --output dist/desktop
+
+  # Validate and diagnose
+  skills-cli validate                       # check installed skills
+  skills-cli validate --repo <url>          # check remote repo
+  skills-cli doctor                         # diagnose directory issues
+
+  # Sync skills from repository
+  skills-cli sync
+
+  # Use custom repository (URL can be positional or with --repo flag)
+  skills-cli list https://github.com/user/my-skills
+  skills-cli list https://github.com/user/dotfiles/tree/master/claude
+  skills-cli install https://github.com/user/my-skills --all
+  skills-cli install https://github.com/user/dotfiles/tree/master/claude -a
+
+  # Alternative: use --repo flag
+  skills-cli list --repo https://github.com/user/my-skills --branch develop
+  skills-cli install --repo https://github.com/user/my-skills --skills skill1,skill2
+"""
+    )
+
+    parser.add_argument(
+        "-v", "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only the invoked command's subparser is built (configuring all of
+    # them costs more than parsing itself); without a recognizable
+    # command, build them all so --help and error messages list every one
+    requested = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    selected = [
+        name for name, (_, aliases, _, _) in COMMANDS.items()
+        if requested == name or requested in aliases
+    ]
+    for name in selected or COMMANDS:
+        help_text, aliases, add_arguments, func = COMMANDS[name]
+        command_parser = subparsers.add_parser(name, aliases=list(aliases), help=help_text)
+        if add_arguments:
+            add_arguments(command_parser)
+        command_parser.set_defaults(func=func)
 
     args = parser.parse_args()
 
@@ -821,6 +1133,8 @@ Examples:
         parser.print_help()
         return 1
 
+    init_colors()
+
     try:
         return args.func(args)
     except KeyboardInterrupt:
@@ -834,5 +1148,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -17,18 +17,22 @@ Design Principles:
     - Clear error handling: return explicit error messages on failure
 """
 
-import json
+import functools
 import os
 import re
-import shutil
-import subprocess
 import sys
-import zipfile
-from datetime import datetime
+from _thread import allocate_lock
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
+# Heavier stdlib modules (json, shutil, subprocess, zipfile) are
+# imported inside the functions that need them, so `--help`/`--version` and
+# other cheap paths don't pay for them at startup. `re` and `urllib.parse`
+# stay at module level because pathlib/argparse import them anyway.
+if TYPE_CHECKING:
+    import subprocess
+
 
 # =============================================================================
 # Global Configuration
@@ -43,6 +47,9 @@ METADATA_FILE = ".skills-cli.json"
 # Required fields in SKILL.md
 REQUIRED_SKILL_FIELDS = ["name", "description"]
 
+# How long a detected default branch stays valid in the on-disk cache (seconds)
+DEFAULT_BRANCH_CACHE_TTL = 24 * 60 * 60
+
 # Common skill subdirectory locations
 COMMON_SKILL_DIRS = [
     "skills",
@@ -80,43 +87,167 @@ class Colors:
         cls.YELLOW = cls.BLUE = cls.CYAN = ""
 
 
-# Windows terminal compatibility handling
-if sys.platform == "win32" and not os.environ.get("WT_SESSION"):
-    try:
-        import colorama
-        colorama.init()
-    except ImportError:
+@functools.lru_cache(maxsize=1)
+def init_colors() -> bool:
+    """
+    Decide whether to color output, with Windows terminal compatibility handling.
+
+    Colors are disabled when NO_COLOR is set (https://no-color.org) or
+    stdout is not a terminal, so piped output carries no escape codes.
+
+    Called from the CLI entry point rather than at import time, so library
+    users and cheap invocations don't pay for the colorama probe. Memoized,
+    so repeated calls in one process (tests, nested commands) are free.
+
+    Returns:
+        True if colored output is enabled
+    """
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
         Colors.disable()
+        return False
+    if sys.platform == "win32" and not os.environ.get("WT_SESSION"):
+        try:
+            import colorama
+            colorama.init()
+        except ImportError:
+            Colors.disable()
+            return False
+    return True
 
 
 # =============================================================================
 # Logging Functions
 # =============================================================================
 
+# Serializes log output from worker threads (install/pack run in parallel).
+# _thread is used instead of threading to keep it out of the startup path.
+_LOG_LOCK = allocate_lock()
+
+
 def log_info(msg: str):
     """Info message (blue ℹ)."""
-    print(f"{Colors.BLUE}ℹ{Colors.RESET} {msg}")
+    with _LOG_LOCK:
+        print(f"{Colors.BLUE}ℹ{Colors.RESET} {msg}")
 
 
 def log_success(msg: str):
     """Success message (green ✓)."""
-    print(f"{Colors.GREEN}✓{Colors.RESET} {msg}")
+    with _LOG_LOCK:
+        print(f"{Colors.GREEN}✓{Colors.RESET} {msg}")
 
 
 def log_warning(msg: str):
     """Warning message (yellow ⚠)."""
-    print(f"{Colors.YELLOW}⚠{Colors.RESET} {msg}")
+    with _LOG_LOCK:
+        print(f"{Colors.YELLOW}⚠{Colors.RESET} {msg}")
 
 
 def log_error(msg: str):
     """Error message (red ✗)."""
-    print(f"{Colors.RED}✗{Colors.RESET} {msg}", file=sys.stderr)
+    with _LOG_LOCK:
+        print(f"{Colors.RED}✗{Colors.RESET} {msg}", file=sys.stderr)
+
+
+# =============================================================================
+# JSON Serialization
+# =============================================================================
+
+def _json_dumps(data, indent: bool = True) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, indented unless indent=False.
+
+    Uses orjson when installed (optional, much faster); otherwise the
+    standard library json module. Files nobody reads by hand should pass
+    indent=False: compact output keeps the stdlib encoder on its C path.
+    """
+    try:
+        import orjson
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    except ImportError:
+        import json
+        if indent:
+            return json.dumps(data, indent=2).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """
+    Deserialize JSON bytes (orjson when installed, else json).
+
+    Raises ValueError on malformed input with either backend.
+    """
+    try:
+        import orjson
+        return orjson.loads(data)
+    except ImportError:
+        import json
+        return json.loads(data)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+def get_cache_dir() -> Path:
+    """Get the skills-cli cache directory (respects XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "skills-cli"
+
+
+def _read_cache_file(name: str) -> dict:
+    """Read a JSON cache file, returning {} if missing or corrupt."""
+    try:
+        data = _json_loads((get_cache_dir() / name).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_file_atomic(path: Path, data: bytes):
+    """
+    Write a file via a temporary sibling and os.replace().
+
+    Readers (including a later run after a crash or Ctrl-C) see either
+    the old contents or the new ones, never a half-written file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _write_cache_file(name: str, data: dict):
+    """
+    Write a JSON cache file. Caching is best-effort, so errors are ignored.
+
+    Written atomically, so concurrent skills-cli runs never see a
+    half-written cache.
+    """
+    try:
+        cache_dir = get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(cache_dir / name, _json_dumps(data, indent=False))
+    except OSError:
+        pass
 
 
 # =============================================================================
 # URL Parsing
 # =============================================================================
 
+# Compiled once at import; parse_repo_url runs for every command invocation.
+# Always used with fullmatch, so each pattern describes the whole URL.
+_GITHUB_TREE_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/tree/([^/]+)(?:/(.*))?")
+_GITLAB_TREE_RE = re.compile(r"(https://[^/]+)/([^/]+/[^/]+)/-/tree/([^/]+)(?:/(.*))?")
+_SSH_RE = re.compile(r"git@([^:]+):(.+?)(?:\.git)?")
+
+
 def parse_repo_url(url: str) -> dict:
     """
     Parse Git repo URL and extract its components.
@@ -127,45 +258,54 @@ def parse_repo_url(url: str) -> dict:
         - Plain HTTPS URL: https://github.com/owner/repo
         - SSH URL: git@github.com:owner/repo.git
 
+    Parsing is memoized per URL; callers get their own copy of the result
+    and may modify it (e.g. to override the branch).
+
     Returns:
-        dict with keys: url, clone_url, branch, subdir, host
+        dict with keys: url, clone_url, branch, subdir, host, and
+        branch_explicit (True when the URL itself names the branch)
     """
+    return dict(_parse_repo_url(url))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_repo_url(url: str) -> dict:
+    """Uncached parse_repo_url; the returned dict must not be mutated."""
     result = {
         "url": url,
         "clone_url": None,
         "branch": "main",
         "subdir": None,
         "host": None,
+        "branch_explicit": False,
     }
 
-    # GitHub tree URL
-    github_tree_match = re.match(
-        r"https://github\.com/([^/]+)/([^/]+)/tree/([^/]+)(?:/(.+))?",
-        url
-    )
-    if github_tree_match:
-        owner, repo, branch, subdir = github_tree_match.groups()
-        result["clone_url"] = f"https://github.com/{owner}/{repo}.git"
-        result["branch"] = branch
-        result["subdir"] = subdir
-        result["host"] = "github"
-        return result
-
-    # GitLab tree URL
-    gitlab_tree_match = re.match(
-        r"(https://[^/]+)/([^/]+/[^/]+)/-/tree/([^/]+)(?:/(.+))?",
-        url
-    )
-    if gitlab_tree_match:
-        host, repo_path, branch, subdir = gitlab_tree_match.groups()
-        result["clone_url"] = f"{host}/{repo_path}.git"
-        result["branch"] = branch
-        result["subdir"] = subdir
-        result["host"] = "gitlab"
-        return result
-
-    # Plain HTTPS URL
-    if url.startswith("https://") or url.startswith("http://"):
+    # Cheap string checks decide which (if any) regex can match
+    if url.startswith(("https://", "http://")):
+        if "/tree/" in url:
+            # GitHub tree URL
+            github_tree_match = url.startswith("https://github.com/") and _GITHUB_TREE_RE.fullmatch(url)
+            if github_tree_match:
+                owner, repo, branch, subdir = github_tree_match.groups()
+                result["clone_url"] = f"https://github.com/{owner}/{repo}.git"
+                result["branch"] = branch
+                result["subdir"] = (subdir or "").strip("/") or None
+                result["host"] = "github"
+                result["branch_explicit"] = True
+                return result
+
+            # GitLab tree URL
+            gitlab_tree_match = "/-/tree/" in url and _GITLAB_TREE_RE.fullmatch(url)
+            if gitlab_tree_match:
+                host, repo_path, branch, subdir = gitlab_tree_match.groups()
+                result["clone_url"] = f"{host}/{repo_path}.git"
+                result["branch"] = branch
+                result["subdir"] = (subdir or "").strip("/") or None
+                result["host"] = "gitlab"
+                result["branch_explicit"] = True
+                return result
+
+        # Plain HTTPS URL
         parsed = urlparse(url)
         result["host"] = parsed.netloc
         path = parsed.path.rstrip("/")
@@ -176,12 +316,13 @@ def parse_repo_url(url: str) -> dict:
         return result
 
     # SSH URL
-    ssh_match = re.match(r"git@([^:]+):(.+?)(?:\.git)?$", url)
-    if ssh_match:
-        host, repo_path = ssh_match.groups()
-        result["clone_url"] = f"git@{host}:{repo_path}.git"
-        result["host"] = host
-        return result
+    if url.startswith("git@"):
+        ssh_match = _SSH_RE.fullmatch(url)
+        if ssh_match:
+            host, repo_path = ssh_match.groups()
+            result["clone_url"] = f"git@{host}:{repo_path}.git"
+            result["host"] = host
+            return result
 
     result["clone_url"] = url
     return result
@@ -191,34 +332,111 @@ def parse_repo_url(url: str) -> dict:
 # Git Operations
 # =============================================================================
 
-def run_git(args: list, cwd: Optional[Path] = None, capture: bool = True) -> subprocess.CompletedProcess:
+def run_git(args: list, cwd: Optional[Path] = None, capture: bool = False) -> "subprocess.CompletedProcess":
     """
     Unified interface for executing Git commands.
 
+    Without capture, stdout is discarded and stderr is kept as raw bytes,
+    decoded only if the command fails. With capture, both streams are
+    returned as text.
+
     Args:
         args: Git command arguments (without 'git' itself)
         cwd: Working directory
         capture: Whether to capture output
     """
+    import subprocess
+
     cmd = ["git"] + args
     try:
-        result = subprocess.run(
+        if capture:
+            return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=True)
+        return subprocess.run(
             cmd,
             cwd=cwd,
-            capture_output=capture,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True
         )
-        return result
     except subprocess.CalledProcessError as e:
         log_error(f"Git command failed: {' '.join(cmd)}")
-        if e.stderr:
-            log_error(e.stderr.strip())
+        stderr = e.stderr
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", errors="replace")
+        if stderr:
+            log_error(stderr.strip())
         raise
 
 
+@functools.lru_cache(maxsize=1)
+def get_git_version() -> tuple:
+    """
+    Get the installed Git version as a tuple, e.g. (2, 39, 5).
+
+    Cached for the lifetime of the process. Returns an empty tuple when
+    Git is missing or the version string cannot be parsed.
+    """
+    import shutil
+    import subprocess
+
+    git = shutil.which("git")
+    if not git:
+        return ()
+    try:
+        result = subprocess.run(
+            [git, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ()
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if not match:
+        return ()
+    return tuple(int(part) for part in match.groups() if part is not None)
+
+
+def _read_head_commit(git_dir: Path) -> Optional[str]:
+    """
+    Resolve HEAD to a full commit hash by reading .git files directly.
+
+    Handles a detached HEAD, loose refs and packed-refs. Returns None if
+    the layout is anything else (the caller falls back to git).
+    """
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head or None
+
+    ref = head[5:]
+    ref_file = git_dir / ref
+    if ref_file.is_file():
+        return ref_file.read_text().strip() or None
+
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    return None
+
+
 def get_git_commit_hash(repo_dir: Path) -> Optional[str]:
-    """Get the current commit hash (short version) of a Git repo."""
+    """
+    Get the current commit hash (short version) of a Git repo.
+
+    Reads .git/HEAD and the ref it points to directly, avoiding a git
+    process; falls back to `git rev-parse` for unusual layouts.
+    """
+    import subprocess
+
+    try:
+        commit = _read_head_commit(repo_dir / ".git")
+        if commit:
+            return commit[:7]
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -234,12 +452,31 @@ def get_git_commit_hash(repo_dir: Path) -> Optional[str]:
     return None
 
 
+# In-process cache of detected default branches, keyed by clone URL
+_DEFAULT_BRANCH_CACHE: dict[str, str] = {}
+_DEFAULT_BRANCH_CACHE_FILE = "default-branches.json"
+
+
 def detect_default_branch(clone_url: str) -> str:
     """
     Auto-detect the default branch name of a remote repo.
 
     Uses `git ls-remote --symref` to query, defaults to "main" on failure.
+    Results are cached in-process and on disk (for DEFAULT_BRANCH_CACHE_TTL
+    seconds) so repeated invocations skip the network round-trip.
     """
+    import subprocess
+    import time
+
+    if clone_url in _DEFAULT_BRANCH_CACHE:
+        return _DEFAULT_BRANCH_CACHE[clone_url]
+
+    disk_cache = _read_cache_file(_DEFAULT_BRANCH_CACHE_FILE)
+    entry = disk_cache.get(clone_url)
+    if isinstance(entry, dict) and time.time() - entry.get("ts", 0) < DEFAULT_BRANCH_CACHE_TTL:
+        _DEFAULT_BRANCH_CACHE[clone_url] = entry["branch"]
+        return entry["branch"]
+
     try:
         result = subprocess.run(
             ["git", "ls-remote", "--symref", clone_url, "HEAD"],
@@ -251,110 +488,620 @@ def detect_default_branch(clone_url: str) -> str:
             for line in result.stdout.split("\n"):
                 if line.startswith("ref: refs/heads/"):
                     branch = line.split("refs/heads/")[1].split()[0]
+                    _DEFAULT_BRANCH_CACHE[clone_url] = branch
+                    disk_cache[clone_url] = {"branch": branch, "ts": time.time()}
+                    _write_cache_file(_DEFAULT_BRANCH_CACHE_FILE, disk_cache)
                     return branch
     except (subprocess.TimeoutExpired, Exception):
         pass
     return "main"
 
 
-def clone_repo(repo_info: dict, target_dir: Path) -> Path:
+_GITHUB_TREES_CACHE_FILE = "github-trees.json"
+
+
+def _github_owner_repo(repo_info: dict) -> Optional[str]:
+    """"owner/repo" for a github.com HTTPS clone URL, else None."""
+    clone_url = repo_info["clone_url"] or ""
+    if not clone_url.startswith("https://github.com/"):
+        return None
+    owner_repo = clone_url[len("https://github.com/"):].removesuffix(".git")
+    return owner_repo if owner_repo.count("/") == 1 else None
+
+
+def _github_headers(headers: dict) -> dict:
+    """Add the User-Agent and, if GITHUB_TOKEN is set, authorization."""
+    headers["User-Agent"] = "skills-cli"
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def list_github_skill_paths(repo_info: dict) -> Optional[list[str]]:
+    """
+    List SKILL.md paths of a GitHub repo via the REST trees API.
+
+    A single HTTPS request replaces a clone when only skill locations are
+    needed. Responses are cached on disk with their ETag; revalidating
+    with If-None-Match returns 304 (which GitHub doesn't count against
+    the rate limit). GITHUB_TOKEN is sent when set.
+
+    Returns:
+        Repo-relative paths of SKILL.md files under repo_info["subdir"],
+        or None if the repo isn't on github.com or the request fails
+        (callers fall back to cloning)
+    """
+    import urllib.error
+    import urllib.request
+    from urllib.parse import quote
+
+    owner_repo = _github_owner_repo(repo_info)
+    if not owner_repo:
+        return None
+
+    api_url = (f"https://api.github.com/repos/{owner_repo}/git/trees/"
+               f"{quote(repo_info['branch'], safe='')}?recursive=1")
+    headers = _github_headers({"Accept": "application/vnd.github+json"})
+
+    cache = _read_cache_file(_GITHUB_TREES_CACHE_FILE)
+    entry = cache.get(api_url)
+    if not isinstance(entry, dict):
+        entry = None
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    try:
+        request = urllib.request.Request(api_url, headers=headers)
+        with urllib.request.urlopen(request, timeout=15) as response:
+            data = _json_loads(response.read())
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not entry:
+            return None
+        all_paths = entry.get("paths", [])
+    except (OSError, ValueError):
+        return None
+    else:
+        # A truncated listing could silently miss skills: clone instead
+        if not isinstance(data, dict) or data.get("truncated"):
+            return None
+        all_paths = [
+            item["path"] for item in data.get("tree", [])
+            if item.get("type") == "blob"
+            and (item["path"] == "SKILL.md" or item["path"].endswith("/SKILL.md"))
+        ]
+        if etag:
+            cache[api_url] = {"etag": etag, "paths": all_paths}
+            _write_cache_file(_GITHUB_TREES_CACHE_FILE, cache)
+
+    subdir = (repo_info["subdir"] or "").strip("/")
+    if not subdir:
+        return all_paths
+    return [path for path in all_paths if path.startswith(subdir + "/")]
+
+
+def read_github_file(repo_info: dict, path: str) -> Optional[bytes]:
+    """
+    Fetch one file of a GitHub repo from raw.githubusercontent.com.
+
+    Together with list_github_skill_paths this lets `list --detail` read
+    just the SKILL.md files, without cloning or downloading the rest of
+    the repo (raw downloads don't count against the API rate limit).
+
+    Returns:
+        The file contents, or None if the repo isn't on github.com or the
+        request fails (callers fall back to cloning)
+    """
+    import urllib.request
+    from urllib.parse import quote
+
+    owner_repo = _github_owner_repo(repo_info)
+    if not owner_repo:
+        return None
+
+    url = f"https://raw.githubusercontent.com/{owner_repo}/{quote(repo_info['branch'])}/{quote(path)}"
+    try:
+        request = urllib.request.Request(url, headers=_github_headers({}))
+        with urllib.request.urlopen(request, timeout=15) as response:
+            return response.read()
+    except (OSError, ValueError):
+        return None
+
+
+# The object cache is opt-in: set this environment variable to 1 to enable it
+_OBJECT_CACHE_ENV = "SKILLS_CLI_OBJECT_CACHE"
+# Object caches unused for this long are pruned (seconds) ...
+_OBJECT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# ... and only this many of the most recently used ones are kept
+_OBJECT_CACHE_MAX_REPOS = 8
+
+
+def _object_cache_enabled() -> bool:
+    """Whether clones should use the local object cache by default."""
+    return os.environ.get(_OBJECT_CACHE_ENV, "") not in ("", "0")
+
+
+def get_object_cache_path(clone_url: str) -> Path:
+    """Get the local object cache (bare repo) path for a clone URL."""
+    import hashlib
+
+    key = hashlib.sha1(clone_url.encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / "git-objects" / f"{key}.git"
+
+
+def update_object_cache(clone_url: str, branch: str) -> Optional[Path]:
+    """
+    Create or refresh the local object cache for a repo.
+
+    The cache is a bare repo tracking `branch` with full history (Git
+    refuses shallow reference repositories), so creating it costs more
+    than one shallow clone; only full clones borrow from it (see
+    clone_repo), and only when enabled. Caches are pruned by age and
+    count after each update.
+
+    Caching is best-effort: returns None on any failure.
+    """
+    lock, cache_path = _open_object_cache(clone_url, branch)
+    if lock is not None:
+        lock.close()
+    return cache_path
+
+
+def _open_object_cache(clone_url: str, branch: str) -> tuple:
+    """
+    Lock, create or refresh, and prune the object cache for a repo.
+
+    Returns (lock, cache_path); cache_path is None if the update failed.
+    The lock (None where locking is unavailable) is still held: callers
+    close it once their clone has finished borrowing from the cache, so
+    concurrent runs never see a half-updated cache and a prune from
+    another run can't delete it mid-clone.
+    """
+    import subprocess
+
+    cache_path = get_object_cache_path(clone_url)
+    lock = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        lock = _lock_file(cache_path.with_name(cache_path.name + ".lock"))
+        if (cache_path / "HEAD").exists():
+            cmd = ["git", "-C", str(cache_path), "fetch", "--quiet", "origin",
+                   f"+refs/heads/{branch}:refs/heads/{branch}"]
+        else:
+            cmd = ["git", "clone", "--bare", "--quiet", "--single-branch", "--branch", branch,
+                   clone_url, str(cache_path)]
+        subprocess.run(cmd, capture_output=True, check=True)
+        # Pruning goes by the cache directory's mtime: mark it as used
+        os.utime(cache_path)
+    except (OSError, subprocess.CalledProcessError):
+        return lock, None
+
+    _prune_object_cache(cache_path)
+    return lock, cache_path
+
+
+def _prune_object_cache(keep: Path):
+    """
+    Delete object caches unused for _OBJECT_CACHE_MAX_AGE, and all but the
+    _OBJECT_CACHE_MAX_REPOS most recently used ones. `keep` (the cache in
+    use) always stays, as do caches another run currently holds locked.
+    """
+    import shutil
+    import time
+
+    try:
+        with os.scandir(keep.parent) as it:
+            caches = sorted(
+                ((entry.stat(follow_symlinks=False).st_mtime, entry.path) for entry in it
+                 if entry.name.endswith(".git") and entry.is_dir(follow_symlinks=False)),
+                reverse=True
+            )
+    except OSError:
+        return
+
+    cutoff = time.time() - _OBJECT_CACHE_MAX_AGE
+    for i, (mtime, path) in enumerate(caches):
+        if path == os.fspath(keep) or (i < _OBJECT_CACHE_MAX_REPOS and mtime >= cutoff):
+            continue
+        lock_path = path + ".lock"
+        try:
+            lock = _lock_file(Path(lock_path), blocking=False)
+        except OSError:
+            continue  # In use by another run
+        try:
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.unlink(lock_path)
+            except OSError:
+                pass
+        finally:
+            if lock is not None:
+                lock.close()
+
+
+def _lock_file(path: Path, blocking: bool = True):
+    """
+    Open path and take an exclusive lock on it.
+
+    Waits for the lock unless blocking=False, in which case an OSError
+    (BlockingIOError) is raised if another process holds it. The lock is
+    released when the returned file is closed. Returns None where fcntl is
+    unavailable (Windows): locking is skipped there.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return None
+
+    lock = open(path, "a")
+    try:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        raise
+    return lock
+
+
+# A full commit SHA (abbreviated ones can't be fetched from a remote)
+_COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def _checkout_commit(clone_url: str, sha: str, target_dir: Path, patterns: Optional[list[str]] = None):
+    """
+    Check out a single pinned commit (`clone --branch` only takes names).
+
+    Fetches just that commit (--depth=1), skipping default-branch
+    detection and the object cache. Sparse patterns are written directly
+    to .git/info/sparse-checkout, which works on every Git version.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    run_git(["init", "--quiet"], cwd=target_dir)
+
+    config = []
+    if patterns:
+        sparse_file = target_dir / ".git" / "info" / "sparse-checkout"
+        sparse_file.parent.mkdir(exist_ok=True)
+        sparse_file.write_text("\n".join(patterns) + "\n")
+        config = ["-c", "core.sparseCheckout=true"]
+
+    run_git(["fetch", "--quiet", "--depth=1", clone_url, sha], cwd=target_dir)
+    run_git([*config, "checkout", "--quiet", "FETCH_HEAD"], cwd=target_dir)
+
+
+def clone_repo(repo_info: dict, target_dir: Path, use_cache: Optional[bool] = None) -> Path:
     """
     Clone a Git repo to the specified directory.
 
     Supports sparse checkout to only download required subdirectories.
+    On Git >= 2.25 this is a partial clone (--filter=blob:none --sparse),
+    so only the blobs under the subdirectory are transferred; if the host
+    rejects the partial clone, a plain shallow sparse fetch is used instead.
+
+    With use_cache, full clones (no subdir) borrow objects from a local
+    object cache (see update_object_cache) so repeated clones only fetch
+    deltas. The default (None) enables it only when the
+    SKILLS_CLI_OBJECT_CACHE environment variable is set. Partial clones
+    never use it: their blobs are fetched lazily into the clone itself,
+    so a cache would only ever hold commits and trees.
 
     Returns:
         The actual skills root directory path
     """
+    import shutil
+    import subprocess
+
     clone_url = repo_info["clone_url"]
     branch = repo_info["branch"]
     subdir = repo_info["subdir"]
 
+    if _COMMIT_SHA_RE.fullmatch(branch):
+        log_info(f"Fetching {clone_url} at commit {branch[:7]}")
+        _checkout_commit(clone_url, branch, target_dir, [f"/{subdir.strip('/')}/"] if subdir else None)
+        return target_dir / subdir if subdir else target_dir
+
     log_info(f"Cloning from {clone_url} (branch: {branch})")
 
     if subdir:
         log_info(f"Using sparse checkout for subdirectory: {subdir}")
 
+    if subdir and get_git_version() >= (2, 25):
+        try:
+            run_git([
+                "clone",
+                "--depth=1",
+                "--filter=blob:none",
+                "--sparse",
+                "--branch", branch,
+                clone_url,
+                str(target_dir)
+            ])
+            run_git(["sparse-checkout", "set", subdir], cwd=target_dir)
+            return target_dir / subdir
+        except subprocess.CalledProcessError:
+            # Some hosts/proxies reject partial clone outright
+            log_warning("Partial clone failed, falling back to a plain sparse checkout")
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+    if subdir:
+        # Git < 2.25 has no `clone --sparse` (or the partial clone was
+        # rejected): set up sparse checkout by hand
         target_dir.mkdir(parents=True, exist_ok=True)
         run_git(["init"], cwd=target_dir)
-        run_git(["remote", "add", "origin", clone_url], cwd=target_dir)
 
-        run_git(["config", "core.sparseCheckout", "true"], cwd=target_dir)
+        # `git init` normally creates .git/info already; only mkdir if it didn't
         sparse_file = target_dir / ".git" / "info" / "sparse-checkout"
-        sparse_file.parent.mkdir(parents=True, exist_ok=True)
-        sparse_file.write_text(f"{subdir}/*\n")
-
-        run_git(["pull", "origin", branch, "--depth=1"], cwd=target_dir)
+        sparse_patterns = f"{subdir}/*\n"
+        try:
+            sparse_file.write_text(sparse_patterns)
+        except FileNotFoundError:
+            sparse_file.parent.mkdir(parents=True)
+            sparse_file.write_text(sparse_patterns)
+
+        # Pull straight from the URL with sparse checkout enabled via -c:
+        # saves both a `remote add` and a `config` spawn
+        run_git(
+            ["-c", "core.sparseCheckout=true", "pull", "--depth=1", clone_url, branch],
+            cwd=target_dir
+        )
 
         return target_dir / subdir
     else:
+        if use_cache is None:
+            use_cache = _object_cache_enabled()
+        lock, cache_path = _open_object_cache(clone_url, branch) if use_cache else (None, None)
+        reference_args = []
+        if cache_path:
+            # --dissociate copies the borrowed objects into the clone, so it
+            # never depends on a cache that may be pruned later
+            reference_args = ["--reference-if-able", str(cache_path), "--dissociate"]
+
+        try:
+            run_git([
+                "clone",
+                "--depth=1",
+                *reference_args,
+                "--branch", branch,
+                clone_url,
+                str(target_dir)
+            ])
+        finally:
+            if lock is not None:
+                lock.close()
+        return target_dir
+
+
+def clone_repo_shallow(repo_info: dict, target_dir: Path, patterns: list[str],
+                       use_cache: Optional[bool] = None) -> Path:
+    """
+    Clone a Git repo, checking out only files matching sparse patterns.
+
+    Patterns use gitignore syntax relative to the repo root (non-cone
+    sparse checkout), e.g. ["**/SKILL.md"] to read skill metadata without
+    materializing any other file. Combined with --filter=blob:none, only
+    the blobs of matching files are transferred. Use narrow_sparse_checkout
+    afterwards to pull in the full contents of selected skills.
+
+    Falls back to clone_repo on Git < 2.35 (no `sparse-checkout --no-cone`)
+    or when the partial clone fails; use_cache only applies to that
+    fallback (see clone_repo).
+
+    Returns:
+        The actual skills root directory path
+    """
+    import shutil
+    import subprocess
+
+    clone_url = repo_info["clone_url"]
+    branch = repo_info["branch"]
+    subdir = repo_info["subdir"]
+
+    if _COMMIT_SHA_RE.fullmatch(branch):
+        log_info(f"Fetching {clone_url} at commit {branch[:7]}")
+        _checkout_commit(clone_url, branch, target_dir, patterns)
+        return target_dir / subdir if subdir else target_dir
+
+    if get_git_version() < (2, 35):
+        return clone_repo(repo_info, target_dir, use_cache=use_cache)
+
+    log_info(f"Cloning from {clone_url} (branch: {branch})")
+
+    try:
         run_git([
             "clone",
             "--depth=1",
+            "--filter=blob:none",
+            "--sparse",
             "--branch", branch,
             clone_url,
             str(target_dir)
         ])
-        return target_dir
+        run_git(["sparse-checkout", "set", "--no-cone", *patterns], cwd=target_dir)
+    except subprocess.CalledProcessError:
+        log_warning("Partial clone failed, falling back to a regular clone")
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return clone_repo(repo_info, target_dir, use_cache=use_cache)
+
+    return target_dir / subdir if subdir else target_dir
+
+
+def narrow_sparse_checkout(repo_dir: Path, paths: list[Path]):
+    """
+    Limit the sparse checkout of repo_dir to the given directories.
+
+    Used after clone_repo_shallow, once the skills to install/pack are
+    known: only their files get materialized (missing blobs are fetched
+    on demand in a single batch). No-op for clones without sparse checkout.
+    """
+    if get_git_version() < (2, 35):
+        return
+    if not (repo_dir / ".git" / "info" / "sparse-checkout").exists():
+        return
+
+    patterns = [f"/{Path(path).relative_to(repo_dir).as_posix()}/" for path in paths]
+    run_git(["sparse-checkout", "set", "--no-cone", *patterns], cwd=repo_dir)
 
 
 # =============================================================================
 # Metadata Tracking
 # =============================================================================
 
-def write_skill_metadata(skill_dir: Path, repo_info: dict, commit_hash: Optional[str] = None):
-    """Write installation source metadata file in the skill directory."""
+def write_skill_metadata(
+    skill_dir: Path,
+    repo_info: dict,
+    commit_hash: Optional[str] = None,
+    installed_at: Optional[str] = None
+):
+    """
+    Write installation source metadata file in the skill directory.
+
+    installed_at defaults to the current local time; batch installs pass
+    one shared value so every skill from the same run carries the same
+    timestamp.
+    """
+    if installed_at is None:
+        import time
+        installed_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
     metadata = {
         "source_url": repo_info.get("url"),
         "clone_url": repo_info.get("clone_url"),
         "branch": repo_info.get("branch"),
         "commit": commit_hash,
-        "installed_at": datetime.now().isoformat(),
+        "installed_at": installed_at,
         "installed_by": "skills-cli",
     }
-    metadata_path = skill_dir / METADATA_FILE
-    metadata_path.write_text(json.dumps(metadata, indent=2))
+    write_file_atomic(skill_dir / METADATA_FILE, _json_dumps(metadata))
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_metadata_file(path: str, signature: tuple) -> Optional[dict]:
+    """Parse a metadata file; cached per (path, stat signature)."""
+    try:
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+    except (ValueError, OSError):
+        return None
 
 
 def read_skill_metadata(skill_dir: Path) -> Optional[dict]:
-    """Read the metadata file from a skill directory."""
-    metadata_path = skill_dir / METADATA_FILE
-    if metadata_path.exists():
-        try:
-            return json.loads(metadata_path.read_text())
-        except (json.JSONDecodeError, IOError):
-            pass
-    return None
+    """
+    Read the metadata file from a skill directory.
+
+    Parsed results are memoized on the file's mtime/size/inode, so listing
+    the same skill more than once in a run (e.g. global and project scopes
+    pointing at the same directory) reads it only once. A rewritten file
+    gets a new signature and is parsed again.
+    """
+    metadata_path = os.path.join(skill_dir, METADATA_FILE)
+    try:
+        st = os.stat(metadata_path)
+    except OSError:
+        return None
+    metadata = _read_metadata_file(metadata_path, (st.st_mtime_ns, st.st_size, st.st_ino))
+    # Hand out a copy so callers can't mutate the cached dict
+    return dict(metadata) if isinstance(metadata, dict) else metadata
 
 
 # =============================================================================
 # Skill Discovery and Parsing
 # =============================================================================
 
+def _skill_sort_key(skill: dict) -> str:
+    """Sort key: display name (falling back to folder name), case-insensitive."""
+    return (skill["name"] or skill["folder_name"]).lower()
+
+
+# Directories never searched for skills (.backup holds backup_skill copies)
+_SKIP_DIRS = frozenset({".git", ".backup", "node_modules", ".venv", "__pycache__"})
+
+
+def is_ignored_skill_dir(name: str) -> bool:
+    """
+    Whether a folder in a skills directory is never treated as a skill.
+
+    Hidden folders (.backup, .git, ...) and _SKIP_DIRS are ignored; shared
+    by discover_skills and doctor so both agree on what counts as a skill.
+    """
+    return name.startswith(".") or name in _SKIP_DIRS
+
+
 def discover_skills(skills_dir: Path) -> list[dict]:
     """
     Discover all skills in a directory.
 
-    Criteria: folder must contain a SKILL.md file.
+    Criteria: folder must contain a SKILL.md file. Hidden folders (.git,
+    .backup, ...) and _SKIP_DIRS are skipped without being probed.
 
     Returns:
         Each skill is a dict containing path, folder_name, name, description
     """
+    import stat
+
     skills = []
 
-    if not skills_dir.exists():
+    # os.scandir reuses the directory entry's file type, so is_dir() needs
+    # no extra stat (except for symlinks, which are still followed)
+    try:
+        entries = os.scandir(skills_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return skills
 
-    for item in skills_dir.iterdir():
-        if item.is_dir():
-            skill_md = item / "SKILL.md"
-            if skill_md.exists():
-                skill_info = parse_skill_md(skill_md)
-                skill_info["path"] = item
-                skill_info["folder_name"] = item.name
+    with entries:
+        for entry in entries:
+            if is_ignored_skill_dir(entry.name):
+                continue
+            if entry.is_dir():
+                # One stat both checks for SKILL.md and keys the parse cache
+                skill_md_path = os.path.join(entry.path, "SKILL.md")
+                try:
+                    st = os.stat(skill_md_path)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                skill_info = dict(_parse_skill_md_file(
+                    skill_md_path, (st.st_mtime_ns, st.st_size, st.st_ino)
+                ))
+                skill_info["path"] = Path(entry.path)
+                skill_info["folder_name"] = entry.name
                 skills.append(skill_info)
 
-    return sorted(skills, key=lambda x: x.get("name", x["folder_name"]))
+    skills.sort(key=_skill_sort_key)
+    return skills
+
+
+def _find_skill_md_files(root: Path, max_depth: int = 3) -> list[Path]:
+    """
+    Find SKILL.md files in subdirectories of root, up to max_depth levels deep.
+
+    Breadth-first over os.scandir, one level at a time: directory entries
+    carry their file type (no per-entry stat), and directories on the last
+    level are only probed for SKILL.md rather than listed in full.
+    """
+    found = []
+    # `level` holds the directories at depth - 1; their entries are at depth
+    level = [os.fspath(root)]
+    for depth in range(1, max_depth + 1):
+        next_level = []
+        for dirpath in level:
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _SKIP_DIRS:
+                            continue
+                        if depth < max_depth:
+                            next_level.append(entry.path)
+                        elif os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                            found.append(Path(entry.path, "SKILL.md"))
+                    elif depth > 1 and entry.name == "SKILL.md":
+                        found.append(Path(entry.path))
+        level = next_level
+    return found
 
 
 def find_skills_root(repo_root: Path) -> tuple[Path, list[dict]]:
@@ -366,6 +1113,8 @@ def find_skills_root(repo_root: Path) -> tuple[Path, list[dict]]:
         2. Common subdirectory names
         3. Recursive search for directories containing SKILL.md
 
+    Steps 2 and 3 share one bounded directory walk.
+
     Returns:
         (skills_root, skills_list)
     """
@@ -374,49 +1123,53 @@ def find_skills_root(repo_root: Path) -> tuple[Path, list[dict]]:
     if skills:
         return repo_root, skills
 
+    # Search for any SKILL.md files (up to 3 levels deep)
+    all_skill_md_files = _find_skill_md_files(repo_root)
+    if not all_skill_md_files:
+        return repo_root, []
+
     # 2. Try common subdirectories
+    skill_parents = {skill_md.parent.parent for skill_md in all_skill_md_files}
     for subdir in COMMON_SKILL_DIRS:
         candidate = repo_root / subdir
-        if candidate.exists() and candidate.is_dir():
+        if candidate in skill_parents:
             skills = discover_skills(candidate)
             if skills:
                 log_info(f"Found skills in: {subdir}/")
                 return candidate, skills
 
-    # 3. Search for any SKILL.md files (up to 3 levels deep)
-    skill_md_files = []
-    for depth in range(1, 4):
-        pattern = "/".join(["*"] * depth) + "/SKILL.md"
-        skill_md_files.extend(repo_root.glob(pattern))
-        if skill_md_files:
-            break
-
-    if skill_md_files:
-        parents = set()
+    # 3. Keep only the shallowest matches. All paths share the repo_root
+    # prefix, so separator counts compare depths without relative_to()
+    depths = [os.fspath(skill_md).count(os.sep) for skill_md in all_skill_md_files]
+    min_depth = min(depths)
+    skill_md_files = [f for f, d in zip(all_skill_md_files, depths) if d == min_depth]
+
+    parents = set()
+    for skill_md in skill_md_files:
+        skill_folder = skill_md.parent
+        skills_root = skill_folder.parent
+        parents.add(skills_root)
+
+    if len(parents) == 1:
+        skills_root = parents.pop()
+        relative = skills_root.relative_to(repo_root)
+        if str(relative) != ".":
+            log_info(f"Found skills in: {relative}/")
+        skills = discover_skills(skills_root)
+        if skills:
+            return skills_root, skills
+    else:
+        log_info("Found skills in multiple directories")
+        all_skills = []
         for skill_md in skill_md_files:
             skill_folder = skill_md.parent
-            skills_root = skill_folder.parent
-            parents.add(skills_root)
-
-        if len(parents) == 1:
-            skills_root = parents.pop()
-            relative = skills_root.relative_to(repo_root)
-            if str(relative) != ".":
-                log_info(f"Found skills in: {relative}/")
-            skills = discover_skills(skills_root)
-            if skills:
-                return skills_root, skills
-        else:
-            log_info("Found skills in multiple directories")
-            all_skills = []
-            for skill_md in skill_md_files:
-                skill_folder = skill_md.parent
-                skill_info = parse_skill_md(skill_md)
-                skill_info["path"] = skill_folder
-                skill_info["folder_name"] = skill_folder.name
-                all_skills.append(skill_info)
-            if all_skills:
-                return repo_root, sorted(all_skills, key=lambda x: x.get("name", x["folder_name"]))
+            skill_info = parse_skill_md(skill_md)
+            skill_info["path"] = skill_folder
+            skill_info["folder_name"] = skill_folder.name
+            all_skills.append(skill_info)
+        if all_skills:
+            all_skills.sort(key=_skill_sort_key)
+            return repo_root, all_skills
 
     return repo_root, []
 
@@ -425,28 +1178,40 @@ def parse_skill_md(skill_md: Path) -> dict:
     """
     Parse the YAML frontmatter from a SKILL.md file.
 
+    Uses the same compiled frontmatter/field regexes as validation, so
+    both agree on what a field is; only the frontmatter is read.
+
+    Results are memoized on the file's mtime/size/inode (like
+    read_skill_metadata), so a SKILL.md seen twice in one run (e.g. when
+    the global and project skills directories coincide) is parsed once.
+
     Returns:
         dict with name and description (may be None)
     """
-    content = skill_md.read_text(encoding="utf-8")
+    path = os.fspath(skill_md)
+    st = os.stat(path)
+    return dict(_parse_skill_md_file(path, (st.st_mtime_ns, st.st_size, st.st_ino)))
 
+
+@functools.lru_cache(maxsize=4096)
+def _parse_skill_md_file(path: str, signature: tuple) -> dict:
+    """Parse a SKILL.md file; cached per (path, stat signature)."""
     result = {
         "name": None,
         "description": None,
     }
 
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = parts[1].strip()
-            for line in frontmatter.split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip().lower()
-                    value = value.strip().strip('"').strip("'")
-                    if key in ("name", "description"):
-                        result[key] = value
+    frontmatter = _read_frontmatter(path)
+    if frontmatter is None:
+        return result
+    try:
+        fields = _parse_frontmatter_fields(frontmatter)
+    except UnicodeDecodeError:
+        return result
 
+    for key in result:
+        if key in fields:
+            result[key] = fields[key]
     return result
 
 
@@ -467,6 +1232,52 @@ def get_claude_skills_dir(scope: str = "personal") -> Path:
         return Path.home() / ".claude" / "skills"
 
 
+def _copy_file_range(src: str, dst: str) -> str:
+    """
+    copytree copy_function using os.copy_file_range.
+
+    The copy happens in the kernel, and on filesystems with reflink
+    support (Btrfs, XFS, ...) it shares extents instead of copying bytes.
+    Falls back to a regular byte copy if the kernel refuses.
+    """
+    import shutil
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copymode(src, dst)
+    return dst
+
+
+def _copy_tree(src: Path, dst: Path):
+    """
+    Copy a directory tree, cloning instead of copying data where possible.
+
+    Strategy:
+        - macOS: `cp -Rc` (APFS clonefile, copy-on-write)
+        - Linux: copytree with os.copy_file_range (reflink-capable)
+        - Otherwise: copytree with shutil.copy (skips timestamp copying)
+    """
+    import shutil
+    import subprocess
+
+    if sys.platform == "darwin":
+        try:
+            subprocess.run(["cp", "-Rc", str(src), str(dst)], capture_output=True, check=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(dst, ignore_errors=True)
+
+    copy_function = _copy_file_range if hasattr(os, "copy_file_range") else shutil.copy
+    shutil.copytree(src, dst, copy_function=copy_function)
+
+
 def backup_skill(skill_path: Path) -> Optional[Path]:
     """
     Backup an existing skill directory.
@@ -474,18 +1285,35 @@ def backup_skill(skill_path: Path) -> Optional[Path]:
     Returns:
         Backup path, or None if directory doesn't exist
     """
+    import time
+
     if not skill_path.exists():
         return None
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_dir = skill_path.parent / ".backup"
     backup_dir.mkdir(exist_ok=True)
     backup_path = backup_dir / f"{skill_path.name}_{timestamp}"
 
-    shutil.copytree(skill_path, backup_path)
+    _copy_tree(skill_path, backup_path)
     return backup_path
 
 
+def remove_skill(skill_path: Path):
+    """
+    Delete an installed skill directory.
+
+    A symlinked skill (e.g. a working copy linked into the skills
+    directory) only loses the link; its target is left untouched.
+    """
+    import shutil
+
+    if os.path.islink(skill_path):
+        os.unlink(skill_path)
+    else:
+        shutil.rmtree(skill_path)
+
+
 def install_skill(
     skill_path: Path,
     target_dir: Path,
@@ -493,11 +1321,25 @@ def install_skill(
     commit_hash: Optional[str] = None,
     force: bool = False,
     backup: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    move: bool = False,
+    skip_unchanged: bool = False,
+    installed_at: Optional[str] = None
 ) -> tuple[bool, str]:
     """
     Install a single skill to the target directory.
 
+    Args:
+        move: Move skill_path into place instead of copying it. Only safe
+            when the source is disposable (e.g. a temporary clone); on the
+            same filesystem this is a single rename instead of a full copy.
+        skip_unchanged: Without force, report an existing skill as
+            unchanged (success) instead of failing if its metadata shows it
+            was installed from the same repo at the same commit (only the
+            small metadata file is read). force always overwrites.
+        installed_at: Timestamp recorded in the skill's metadata (see
+            write_skill_metadata); defaults to now.
+
     Returns:
         (success, message) tuple
     """
@@ -507,6 +1349,11 @@ def install_skill(
 
     if dest_path.exists():
         if not force:
+            if skip_unchanged and repo_info and commit_hash:
+                installed = read_skill_metadata(dest_path)
+                if (installed and installed.get("commit") == commit_hash
+                        and installed.get("clone_url") == repo_info.get("clone_url")):
+                    return (True, f"unchanged (already at {commit_hash})")
             return (False, f"already exists (use --force to overwrite)")
         action = "overwrite"
 
@@ -517,36 +1364,115 @@ def install_skill(
             backup_path = backup_skill(dest_path)
             if backup_path:
                 log_info(f"Backed up to: {backup_path}")
-
-        shutil.rmtree(dest_path)
     else:
         if dry_run:
             return (True, f"would install to {dest_path}")
 
-    shutil.copytree(skill_path, dest_path)
+    # Build the new tree under a hidden name (skipped by discovery), then
+    # rename it into place: an interrupted install never leaves a partial
+    # skill behind, and an existing skill is only swapped out at the end
+    staging_path = target_dir / f".{skill_name}.new"
+    _remove_stale(staging_path)
+
+    moved = False
+    if move:
+        try:
+            os.rename(skill_path, staging_path)
+            moved = True
+        except OSError:
+            # Typically EXDEV (different filesystems): fall back to copying
+            pass
+
+    if not moved:
+        _copy_tree(skill_path, staging_path)
 
     if repo_info:
-        write_skill_metadata(dest_path, repo_info, commit_hash)
+        write_skill_metadata(staging_path, repo_info, commit_hash, installed_at)
+
+    if action == "install":
+        os.rename(staging_path, dest_path)
+        return (True, "installed")
+
+    old_path = target_dir / f".{skill_name}.old"
+    _remove_stale(old_path)
+    os.rename(dest_path, old_path)
+    try:
+        os.rename(staging_path, dest_path)
+    except OSError:
+        os.rename(old_path, dest_path)
+        raise
+    remove_skill(old_path)
+
+    return (True, "updated")
+
 
-    return (True, "installed" if action == "install" else "updated")
+def _remove_stale(path: Path):
+    """Remove a staging path left behind by an interrupted install."""
+    if os.path.lexists(path):
+        remove_skill(path)
+
+
+# Already-compressed formats: deflating them again only burns CPU
+_STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".pdf", ".docx", ".xlsx", ".pptx",
+    ".zip", ".whl", ".gz", ".bz2", ".xz", ".woff2", ".mp4",
+})
+
+
+def _iter_pack_files(dirpath: str, arc_dir: str):
+    """
+    Yield (file_path, arcname) for the regular files under dirpath.
+
+    Walks with os.scandir in sorted order, a directory's files before its
+    subdirectories. Entry types come from the directory listing, so no
+    extra stat is needed to classify them; arcnames are built by joining
+    names rather than calling relpath per file. Symlinks to files are
+    followed, but broken links, sockets and FIFOs (which would make
+    ZipFile.write fail or block) are skipped, and directory symlinks are
+    not descended into.
+    """
+    with os.scandir(dirpath) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry)
+        elif entry.is_file():
+            yield entry.path, os.path.join(arc_dir, entry.name)
+
+    for entry in subdirs:
+        yield from _iter_pack_files(entry.path, os.path.join(arc_dir, entry.name))
 
 
 def pack_skill(skill_path: Path, output_dir: Path) -> Path:
     """
     Pack a skill into a zip file.
 
+    Text files are deflated at level 1 (much faster than the default
+    level 6 for a slightly larger archive); already-compressed assets
+    are stored as-is.
+
     Returns:
         Path to the zip file
     """
+    import zipfile
+
     skill_name = skill_path.name
     zip_path = output_dir / f"{skill_name}.zip"
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file_path in skill_path.rglob("*"):
-            if file_path.is_file():
-                arcname = file_path.relative_to(skill_path.parent)
+    # strict_timestamps=False clamps pre-1980 mtimes (e.g. files extracted
+    # with a zero timestamp) instead of failing the whole pack
+    with zipfile.ZipFile(
+        zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1, strict_timestamps=False
+    ) as zf:
+        for file_path, arcname in _iter_pack_files(os.fspath(skill_path), skill_path.name):
+            if os.path.splitext(arcname)[1].lower() in _STORED_EXTENSIONS:
+                zf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
                 zf.write(file_path, arcname)
 
     log_success(f"Packed: {zip_path}")
@@ -557,49 +1483,136 @@ def pack_skill(skill_path: Path, output_dir: Path) -> Path:
 # Validation
 # =============================================================================
 
+# Frontmatter block: opening "---" line through the closing "---" line
+_FRONTMATTER_RE = re.compile(rb"\A---[^\n]*\n(.*?)^---[ \t]*\r?$", re.DOTALL | re.MULTILINE)
+# Top-level "key: value" lines inside the frontmatter
+_FIELD_RE = re.compile(rb"^([A-Za-z0-9_-]+)[ \t]*:(.*)$", re.MULTILINE)
+
+# Indented lines: block scalars (description: >) or continuation lines
+_CONTINUATION_RE = re.compile(rb"^[ \t]+\S", re.MULTILINE)
+
+# Bytes of SKILL.md read up front; frontmatter virtually always fits
+_FRONTMATTER_READ_SIZE = 8192
+
+
+def _unquote(value: str) -> str:
+    """Strip one matching pair of surrounding quotes; inner quotes are kept."""
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def _parse_frontmatter_fields(frontmatter: bytes) -> dict:
+    """
+    Extract top-level "key: value" fields from frontmatter bytes.
+
+    Single-line fields are matched with a regex. Multi-line values can't
+    be read that way, so when indented lines are present and PyYAML is
+    installed (optional), the frontmatter is parsed as YAML instead, with
+    the libyaml-backed CSafeLoader when available.
+    """
+    fields = {
+        key.decode("ascii").lower(): _unquote(value.decode("utf-8").strip())
+        for key, value in _FIELD_RE.findall(frontmatter)
+    }
+    if not _CONTINUATION_RE.search(frontmatter):
+        return fields
+
+    try:
+        import yaml
+    except ImportError:
+        return fields
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        data = yaml.load(frontmatter, Loader=loader)
+    except yaml.YAMLError:
+        return fields
+    if not isinstance(data, dict):
+        return fields
+    return {
+        str(key).lower(): "" if value is None else str(value).strip()
+        for key, value in data.items()
+    }
+
+
+def _read_frontmatter(path: str) -> Optional[bytes]:
+    """
+    Read just the frontmatter block of a SKILL.md file.
+
+    The first _FRONTMATTER_READ_SIZE bytes are read; the rest of the file
+    only if the closing "---" isn't within them.
+
+    Returns:
+        The bytes between the "---" lines, or None without frontmatter
+    """
+    with open(path, "rb") as f:
+        content = f.read(_FRONTMATTER_READ_SIZE)
+        if not content.startswith(b"---"):
+            return None
+        match = _FRONTMATTER_RE.match(content)
+        if not match and len(content) == _FRONTMATTER_READ_SIZE:
+            content += f.read()
+            match = _FRONTMATTER_RE.match(content)
+    return match.group(1) if match else None
+
+
 def validate_skill_md(skill_path: Path) -> list[str]:
     """
     Validate a skill's SKILL.md format.
 
+    Only the first _FRONTMATTER_READ_SIZE bytes are read unless the
+    frontmatter (or the start of the body) lies beyond them.
+
     Returns:
         List of issues, empty list if validation passes
     """
-    issues = []
-    skill_md = skill_path / "SKILL.md"
-
-    if not skill_md.exists():
-        issues.append("Missing SKILL.md file")
-        return issues
-
     try:
-        content = skill_md.read_text(encoding="utf-8")
+        with open(skill_path / "SKILL.md", "rb") as f:
+            content = f.read(_FRONTMATTER_READ_SIZE)
+            if len(content) == _FRONTMATTER_READ_SIZE and content.startswith(b"---"):
+                match = _FRONTMATTER_RE.match(content)
+                if not match or not content[match.end():].strip():
+                    content += f.read()
+    except FileNotFoundError:
+        return ["Missing SKILL.md file"]
     except Exception as e:
-        issues.append(f"Cannot read SKILL.md: {e}")
-        return issues
+        return [f"Cannot read SKILL.md: {e}"]
+
+    return validate_skill_md_from_bytes(content)
+
+
+def validate_skill_md_from_bytes(content: bytes) -> list[str]:
+    """
+    Validate SKILL.md content that has already been read.
+
+    Lets callers that read SKILL.md anyway (e.g. while scanning a skills
+    directory) validate without opening the file again.
 
-    if not content.startswith("---"):
+    Returns:
+        List of issues, empty list if validation passes
+    """
+    issues = []
+
+    if not content.startswith(b"---"):
         issues.append("Missing YAML frontmatter (should start with ---)")
         return issues
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
         issues.append("Invalid YAML frontmatter (missing closing ---)")
         return issues
 
-    frontmatter = parts[1].strip()
-    body = parts[2].strip()
-
-    metadata = {}
-    for line in frontmatter.split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            metadata[key.strip().lower()] = value.strip().strip('"').strip("'")
+    try:
+        metadata = _parse_frontmatter_fields(match.group(1))
+    except UnicodeDecodeError as e:
+        issues.append(f"Cannot read SKILL.md: {e}")
+        return issues
 
     for field in REQUIRED_SKILL_FIELDS:
         if field not in metadata or not metadata[field]:
             issues.append(f"Missing required field: {field}")
 
-    if not body:
+    if not content[match.end():].strip():
         issues.append("Empty skill body (no instructions after frontmatter)")
 
     if metadata.get("name") and len(metadata["name"]) > 50:
@@ -5,17 +5,65 @@ These tests ensure the core logic works correctly before and after refactoring.
 Run with: python -m pytest tests/ -v
 """
 
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from skills_cli import (
     parse_repo_url,
+    run_git,
+    get_git_version,
+    get_git_commit_hash,
+    detect_default_branch,
+    list_github_skill_paths,
+    read_github_file,
+    get_object_cache_path,
+    update_object_cache,
+    clone_repo,
+    clone_repo_shallow,
+    narrow_sparse_checkout,
     discover_skills,
     find_skills_root,
     parse_skill_md,
+    backup_skill,
+    install_skill,
+    remove_skill,
+    write_skill_metadata,
+    read_skill_metadata,
+    write_file_atomic,
+    pack_skill,
     validate_skill_md,
+    validate_skill_md_from_bytes,
     COMMON_SKILL_DIRS,
 )
+from skills_cli.cli import _parse_selection, scan_skills_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    """Keep cache writes (default branches, object cache) out of the real home."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+def make_git_repo(repo_dir: Path, branch: str = "main") -> Path:
+    """Create a local Git repo with two skills under skills/ and a docs/ folder."""
+    for name in ("pdf", "xlsx"):
+        skill_dir = repo_dir / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: Test\n---\nContent"
+        )
+    (repo_dir / "docs").mkdir()
+    (repo_dir / "docs" / "guide.md").write_text("# Guide")
+
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init", "-q", "-b", branch], cwd=repo_dir, check=True)
+    subprocess.run(git + ["add", "."], cwd=repo_dir, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], cwd=repo_dir, check=True)
+    return repo_dir
 
 
 class TestParseRepoUrl:
@@ -30,6 +78,7 @@ class TestParseRepoUrl:
         assert result["branch"] == "main"
         assert result["subdir"] == "skills"
         assert result["host"] == "github"
+        assert result["branch_explicit"] is True
 
     def test_github_tree_url_without_subdir(self):
         """Parse GitHub tree URL without subdirectory."""
@@ -50,6 +99,17 @@ class TestParseRepoUrl:
         assert result["branch"] == "main"
         assert result["subdir"] == "packages/skills/claude"
 
+    def test_tree_url_trailing_slash(self):
+        """Trailing slashes (as copied from a browser) don't end up in subdir."""
+        result = parse_repo_url("https://github.com/org/repo/tree/main/skills/")
+        assert result["branch"] == "main"
+        assert result["subdir"] == "skills"
+
+        result = parse_repo_url("https://gitlab.com/org/repo/-/tree/dev/")
+        assert result["clone_url"] == "https://gitlab.com/org/repo.git"
+        assert result["branch"] == "dev"
+        assert result["subdir"] is None
+
     def test_gitlab_tree_url(self):
         """Parse GitLab tree URL."""
         url = "https://gitlab.com/company/team-repo/-/tree/main/skills"
@@ -68,6 +128,7 @@ class TestParseRepoUrl:
         assert result["clone_url"] == "https://github.com/user/repo.git"
         assert result["branch"] == "main"  # default
         assert result["subdir"] is None
+        assert result["branch_explicit"] is False
 
     def test_https_url_with_git_suffix(self):
         """Parse HTTPS URL that already has .git suffix."""
@@ -91,6 +152,14 @@ class TestParseRepoUrl:
 
         assert result["clone_url"] == "git@github.com:user/repo.git"
 
+    def test_local_path_passthrough(self):
+        """Non-URL input is used as the clone URL unchanged."""
+        result = parse_repo_url("/srv/git/skills")
+
+        assert result["clone_url"] == "/srv/git/skills"
+        assert result["host"] is None
+        assert result["subdir"] is None
+
     def test_self_hosted_gitlab(self):
         """Parse self-hosted GitLab URL."""
         url = "https://git.company.com/team/project/-/tree/develop/skills"
@@ -100,6 +169,361 @@ class TestParseRepoUrl:
         assert result["branch"] == "develop"
         assert result["subdir"] == "skills"
 
+    def test_result_is_a_fresh_copy(self):
+        """Mutating a parse result doesn't leak into later calls."""
+        url = "https://github.com/anthropics/skills"
+        parse_repo_url(url)["branch"] = "feature"
+
+        assert parse_repo_url(url)["branch"] == "main"
+
+
+class TestParseSelection:
+    """Tests for the interactive selection parser."""
+
+    def test_numbers_and_ranges(self):
+        """Numbers and ranges become sorted, unique 0-based indices."""
+        assert _parse_selection("5, 1-3,2", 10) == [0, 1, 2, 4]
+
+    def test_all(self):
+        """'all', '*' and an empty answer select everything."""
+        for selection in ("all", "*", ""):
+            assert _parse_selection(selection, 3) == [0, 1, 2]
+
+    def test_ranges_are_clamped(self):
+        """Out-of-range bounds are clamped, reversed ranges accepted."""
+        assert _parse_selection("0-999999999", 3) == [0, 1, 2]
+        assert _parse_selection("3-2,7", 3) == [1, 2]
+
+    def test_invalid(self):
+        """Non-numeric parts are rejected."""
+        with pytest.raises(ValueError):
+            _parse_selection("1,x", 3)
+
+
+class TestGitOperations:
+    """Tests for Git helpers against a local repository."""
+
+    def test_run_git_discards_stdout(self):
+        """Without capture, run_git only reports the exit status."""
+        result = run_git(["--version"])
+
+        assert result.returncode == 0
+        assert result.stdout is None
+
+    def test_run_git_raises_on_failure(self):
+        """Failing commands raise CalledProcessError."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with pytest.raises(subprocess.CalledProcessError):
+                run_git(["rev-parse", "HEAD"], cwd=Path(tmp))
+
+    def test_clone_repo_full(self):
+        """Clone a whole repository."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": None}
+
+            cloned_root = clone_repo(repo_info, Path(tmp) / "clone")
+
+            assert (cloned_root / "docs" / "guide.md").exists()
+            assert (cloned_root / "skills" / "pdf" / "SKILL.md").exists()
+
+    def test_clone_repo_uses_object_cache(self):
+        """With the cache enabled, full clones prime it but don't depend on it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": None}
+
+            cache_path = get_object_cache_path(repo.as_uri())
+            for name in ("clone1", "clone2"):
+                cloned_root = clone_repo(repo_info, Path(tmp) / name, use_cache=True)
+
+                assert (cache_path / "HEAD").exists()
+                assert not (cloned_root / ".git" / "objects" / "info" / "alternates").exists()
+                assert (cloned_root / "skills" / "pdf" / "SKILL.md").exists()
+
+    def test_object_cache_locked_during_clone(self, monkeypatch):
+        """The cache stays locked until the clone borrowing from it is done."""
+        import fcntl
+
+        real_run_git = run_git
+        held = []
+
+        def check_lock(args, cwd=None, capture=False):
+            if args[0] == "clone":
+                lock_path = get_object_cache_path(repo.as_uri()).with_suffix(".git.lock")
+                with open(lock_path, "a") as f:
+                    try:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        held.append(False)
+                    except BlockingIOError:
+                        held.append(True)
+            return real_run_git(args, cwd=cwd, capture=capture)
+
+        monkeypatch.setattr("skills_cli.core.run_git", check_lock)
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": None}
+
+            clone_repo(repo_info, Path(tmp) / "clone", use_cache=True)
+
+        assert held == [True]
+
+    def test_object_cache_is_opt_in(self, monkeypatch):
+        """The cache is only used when enabled, and never for partial clones."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            cache_path = get_object_cache_path(repo.as_uri())
+
+            clone_repo({"clone_url": repo.as_uri(), "branch": "main", "subdir": None},
+                       Path(tmp) / "clone1")
+            assert not cache_path.exists()
+
+            monkeypatch.setenv("SKILLS_CLI_OBJECT_CACHE", "1")
+            clone_repo({"clone_url": repo.as_uri(), "branch": "main", "subdir": "skills"},
+                       Path(tmp) / "clone2")
+            assert not cache_path.exists()
+
+            clone_repo({"clone_url": repo.as_uri(), "branch": "main", "subdir": None},
+                       Path(tmp) / "clone3")
+            assert cache_path.exists()
+
+    def test_object_cache_prunes_stale_entries(self):
+        """Caches unused for too long are deleted on the next update."""
+        import os
+        import time
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            cache_path = get_object_cache_path(repo.as_uri())
+            stale = cache_path.with_name("0123456789abcdef.git")
+            fresh = cache_path.with_name("fedcba9876543210.git")
+            for path in (stale, fresh):
+                path.mkdir(parents=True)
+            old = time.time() - 60 * 24 * 60 * 60
+            os.utime(stale, (old, old))
+
+            assert update_object_cache(repo.as_uri(), "main") == cache_path
+
+            assert not stale.exists()
+            assert fresh.exists()
+            assert cache_path.exists()
+
+    def test_object_cache_concurrent_updates(self):
+        """Concurrent updates of one cache wait for each other instead of failing."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(
+                    lambda _: update_object_cache(repo.as_uri(), "main"), range(4)
+                ))
+
+            assert results == [get_object_cache_path(repo.as_uri())] * 4
+
+    def test_clone_repo_sparse_subdir(self):
+        """Clone only the requested subdirectory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": "skills"}
+
+            cloned_root = clone_repo(repo_info, Path(tmp) / "clone")
+
+            assert cloned_root == Path(tmp) / "clone" / "skills"
+            assert (cloned_root / "pdf" / "SKILL.md").exists()
+            assert (cloned_root / "xlsx" / "SKILL.md").exists()
+            assert not (Path(tmp) / "clone" / "docs").exists()
+
+    def test_clone_repo_sparse_subdir_legacy_git(self, monkeypatch):
+        """Fall back to manual sparse checkout on Git < 2.25."""
+        monkeypatch.setattr("skills_cli.core.get_git_version", lambda: (2, 20, 0))
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": "skills"}
+
+            cloned_root = clone_repo(repo_info, Path(tmp) / "clone")
+
+            assert (cloned_root / "pdf" / "SKILL.md").exists()
+            assert not (Path(tmp) / "clone" / "docs").exists()
+
+    def test_clone_repo_partial_clone_rejected(self, monkeypatch):
+        """Fall back to manual sparse checkout when the partial clone fails."""
+        real_run_git = run_git
+
+        def reject_filter(args, cwd=None, capture=False):
+            if "--filter=blob:none" in args:
+                raise subprocess.CalledProcessError(128, ["git", *args])
+            return real_run_git(args, cwd=cwd, capture=capture)
+
+        monkeypatch.setattr("skills_cli.core.run_git", reject_filter)
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": "skills"}
+
+            cloned_root = clone_repo(repo_info, Path(tmp) / "clone", use_cache=False)
+
+            assert (cloned_root / "pdf" / "SKILL.md").exists()
+            assert not (Path(tmp) / "clone" / "docs").exists()
+
+    def test_clone_repo_commit_sha(self):
+        """A full commit SHA as branch checks out that commit."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            sha = subprocess.run(
+                ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True, check=True
+            ).stdout.strip()
+            repo_info = {"clone_url": repo.as_uri(), "branch": sha, "subdir": "skills"}
+
+            cloned_root = clone_repo(repo_info, Path(tmp) / "clone")
+
+            assert (cloned_root / "pdf" / "SKILL.md").exists()
+            assert not (Path(tmp) / "clone" / "docs").exists()
+            assert get_git_commit_hash(Path(tmp) / "clone") == sha[:7]
+
+    @pytest.mark.skipif(get_git_version() < (2, 35), reason="needs sparse-checkout --no-cone")
+    def test_clone_repo_shallow_then_narrow(self):
+        """Check out only SKILL.md files, then the full selected skill."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            (repo / "skills" / "pdf" / "reference.md").write_text("# Reference")
+            git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            subprocess.run(git + ["add", "."], cwd=repo, check=True)
+            subprocess.run(git + ["commit", "-q", "-m", "ref"], cwd=repo, check=True)
+            repo_info = {"clone_url": repo.as_uri(), "branch": "main", "subdir": None}
+            clone_dir = Path(tmp) / "clone"
+
+            cloned_root = clone_repo_shallow(repo_info, clone_dir, ["**/SKILL.md"])
+
+            assert (cloned_root / "skills" / "xlsx" / "SKILL.md").exists()
+            assert not (cloned_root / "skills" / "pdf" / "reference.md").exists()
+            assert not (cloned_root / "docs").exists()
+
+            narrow_sparse_checkout(clone_dir, [clone_dir / "skills" / "pdf"])
+
+            assert (cloned_root / "skills" / "pdf" / "reference.md").exists()
+            assert not (cloned_root / "skills" / "xlsx").exists()
+
+    def test_detect_default_branch_cached(self, monkeypatch):
+        """Detected default branch is reused from the in-process and disk caches."""
+        from skills_cli import core
+
+        with tempfile.TemporaryDirectory() as tmp:
+            monkeypatch.setattr(core, "_DEFAULT_BRANCH_CACHE", {})
+            repo = make_git_repo(Path(tmp) / "origin", branch="trunk")
+            clone_url = repo.as_uri()
+
+            assert detect_default_branch(clone_url) == "trunk"
+
+            # Remove the remote: both cache layers must answer without it
+            shutil.rmtree(repo)
+            assert detect_default_branch(clone_url) == "trunk"
+            core._DEFAULT_BRANCH_CACHE.clear()
+            assert detect_default_branch(clone_url) == "trunk"
+
+    def test_detect_default_branch_cache_written_atomically(self, monkeypatch):
+        """The on-disk cache is replaced in one step, leaving no temp files."""
+        from skills_cli import core
+
+        with tempfile.TemporaryDirectory() as tmp:
+            monkeypatch.setattr(core, "_DEFAULT_BRANCH_CACHE", {})
+            repo = make_git_repo(Path(tmp) / "origin", branch="trunk")
+
+            detect_default_branch(repo.as_uri())
+
+            cache_dir = core.get_cache_dir()
+            assert [p.name for p in cache_dir.iterdir() if p.is_file()] == ["default-branches.json"]
+
+    def test_list_github_skill_paths(self, monkeypatch):
+        """Tree API listing is filtered to SKILL.md files and revalidated via ETag."""
+        import io
+        import json
+        import urllib.error
+        import urllib.request
+
+        tree = {"truncated": False, "tree": [
+            {"path": "skills/pdf/SKILL.md", "type": "blob"},
+            {"path": "skills/pdf/ref.md", "type": "blob"},
+            {"path": "other/x/SKILL.md", "type": "blob"},
+            {"path": "skills/pdf", "type": "tree"},
+        ]}
+        requests = []
+
+        class Response(io.BytesIO):
+            headers = {"ETag": '"abc"'}
+
+        def fake_urlopen(request, timeout):
+            requests.append(request)
+            if request.get_header("If-none-match") == '"abc"':
+                raise urllib.error.HTTPError(request.full_url, 304, "Not Modified", {}, None)
+            return Response(json.dumps(tree).encode())
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        repo_info = parse_repo_url("https://github.com/owner/repo/tree/main/skills")
+
+        assert list_github_skill_paths(repo_info) == ["skills/pdf/SKILL.md"]
+        assert list_github_skill_paths(repo_info) == ["skills/pdf/SKILL.md"]
+        assert "/repos/owner/repo/git/trees/main" in requests[0].full_url
+        assert len(requests) == 2
+
+    def test_list_github_skill_paths_non_github(self):
+        """Non-GitHub repos are left to the clone path."""
+        repo_info = parse_repo_url("https://gitlab.com/owner/repo")
+
+        assert list_github_skill_paths(repo_info) is None
+
+    def test_read_github_file(self, monkeypatch):
+        """Single files come from raw.githubusercontent.com; failures give None."""
+        import io
+        import urllib.error
+        import urllib.request
+
+        def fake_urlopen(request, timeout):
+            if request.full_url.endswith("/missing/SKILL.md"):
+                raise urllib.error.HTTPError(request.full_url, 404, "Not Found", {}, None)
+            return io.BytesIO(request.full_url.encode())
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        repo_info = parse_repo_url("https://github.com/owner/repo")
+        repo_info["branch"] = "release/1.0"
+
+        assert read_github_file(repo_info, "skills/pdf/SKILL.md") == (
+            b"https://raw.githubusercontent.com/owner/repo/release/1.0/skills/pdf/SKILL.md"
+        )
+        assert read_github_file(repo_info, "missing/SKILL.md") is None
+        assert read_github_file(parse_repo_url("git@github.com:owner/repo.git"), "SKILL.md") is None
+
+    def test_get_git_commit_hash(self):
+        """Commit hash from .git files matches git rev-parse."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = make_git_repo(Path(tmp) / "origin")
+            expected = subprocess.run(
+                ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True
+            ).stdout.strip()
+
+            assert get_git_commit_hash(repo) == expected[:7]
+
+            # Packed refs
+            subprocess.run(["git", "pack-refs", "--all"], cwd=repo, check=True)
+            assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+            assert get_git_commit_hash(repo) == expected[:7]
+
+            # Detached HEAD
+            subprocess.run(["git", "checkout", "-q", "--detach"], cwd=repo, check=True)
+            assert get_git_commit_hash(repo) == expected[:7]
+
+    def test_get_git_commit_hash_not_a_repo(self):
+        """Non-repositories have no commit hash."""
+        with tempfile.TemporaryDirectory() as tmp:
+            assert get_git_commit_hash(Path(tmp)) is None
+
+    def test_get_git_version(self):
+        """Installed Git version is parsed into a tuple."""
+        version = get_git_version()
+
+        assert len(version) >= 2
+        assert all(isinstance(part, int) for part in version)
+
 
 class TestDiscoverSkills:
     """Tests for discover_skills function."""
@@ -127,6 +551,50 @@ class TestDiscoverSkills:
             assert "PDF Tool" in names
             assert "Excel Tool" in names
 
+    def test_discover_skills_skips_hidden_dirs(self):
+        """Hidden folders such as .backup are never treated as skills."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skills_dir = Path(tmp)
+            for folder in ("pdf", ".backup", "node_modules"):
+                (skills_dir / folder).mkdir()
+                (skills_dir / folder / "SKILL.md").write_text("---\nname: X\n---\nContent")
+
+            skills = discover_skills(skills_dir)
+
+            assert [s["folder_name"] for s in skills] == ["pdf"]
+
+    def test_doctor_scan_ignores_the_same_dirs(self):
+        """doctor's scan skips exactly the folders discover_skills skips."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skills_dir = Path(tmp)
+            (skills_dir / "my-skill").mkdir()
+            (skills_dir / "my-skill" / "SKILL.md").write_text("---\nname: Mine\n---\n")
+            for name in (".backup", "node_modules", "__pycache__"):
+                (skills_dir / name).mkdir()
+            (skills_dir / "stray").mkdir()
+
+            skills, orphaned = scan_skills_dir(skills_dir)
+
+            assert list(skills) == ["my-skill"]
+            assert orphaned == [skills_dir / "stray"]
+            assert [s["folder_name"] for s in discover_skills(skills_dir)] == ["my-skill"]
+
+    def test_discover_skills_sorted_with_missing_names(self):
+        """Skills without a name sort by folder name instead of failing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skills_dir = Path(tmp)
+            for folder, content in [
+                ("zeta", "---\nname: zeta\n---\nContent"),
+                ("beta", "# No frontmatter"),
+                ("alpha", "---\nname: Alpha\n---\nContent"),
+            ]:
+                (skills_dir / folder).mkdir()
+                (skills_dir / folder / "SKILL.md").write_text(content)
+
+            skills = discover_skills(skills_dir)
+
+            assert [s["folder_name"] for s in skills] == ["alpha", "beta", "zeta"]
+
     def test_discover_skills_empty_directory(self):
         """Return empty list for directory without skills."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -152,10 +620,28 @@ class TestDiscoverSkills:
             # Create directory without SKILL.md
             (skills_dir / "not-a-skill").mkdir()
             (skills_dir / "not-a-skill" / "README.md").write_text("# Not a skill")
+            # A directory named SKILL.md doesn't count either
+            (skills_dir / "odd" / "SKILL.md").mkdir(parents=True)
 
             skills = discover_skills(skills_dir)
             assert skills == []
 
+    def test_discover_skills_follows_symlinked_skill(self):
+        """Symlinked skill directories are still discovered."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "work" / "my-skill"
+            source.mkdir(parents=True)
+            (source / "SKILL.md").write_text("---\nname: Linked\n---\nContent")
+
+            skills_dir = Path(tmp) / "skills"
+            skills_dir.mkdir()
+            (skills_dir / "my-skill").symlink_to(source, target_is_directory=True)
+
+            skills = discover_skills(skills_dir)
+
+            assert [s["name"] for s in skills] == ["Linked"]
+            assert skills[0]["path"] == skills_dir / "my-skill"
+
     def test_discover_skills_nonexistent_directory(self):
         """Return empty list for nonexistent directory."""
         skills = discover_skills(Path("/nonexistent/path"))
@@ -232,6 +718,28 @@ class TestFindSkillsRoot:
             assert len(skills) == 1
             assert skills[0].get("name") == "Deep Skill"
 
+    def test_find_skills_ignores_vendored_dirs(self):
+        """Skip node_modules, .backup and similar directories during the deep search."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+
+            vendored = repo_root / "node_modules" / "pkg" / "vendored-skill"
+            vendored.mkdir(parents=True)
+            (vendored / "SKILL.md").write_text("---\nname: Vendored\n---\nContent")
+
+            backup = repo_root / ".backup" / "my-skill_20240101_000000"
+            backup.mkdir(parents=True)
+            (backup / "SKILL.md").write_text("---\nname: Backup\n---\nContent")
+
+            real = repo_root / "packages" / "tools" / "my-skill"
+            real.mkdir(parents=True)
+            (real / "SKILL.md").write_text("---\nname: Real\n---\nContent")
+
+            skills_root, skills = find_skills_root(repo_root)
+
+            assert skills_root == repo_root / "packages" / "tools"
+            assert [s["name"] for s in skills] == ["Real"]
+
 
 class TestParseSkillMd:
     """Tests for parse_skill_md function."""
@@ -262,6 +770,33 @@ class TestParseSkillMd:
             assert result["name"] == "Quoted Name"
             assert result["description"] == "Single quoted"
 
+    def test_parse_frontmatter_keeps_inner_quotes(self):
+        """Only a matching pair of surrounding quotes is stripped."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_md = Path(tmp) / "SKILL.md"
+            skill_md.write_text(
+                "---\nname: Tool: v2\ndescription: 'Use the \"fast\" mode'\n---\nContent"
+            )
+
+            result = parse_skill_md(skill_md)
+
+            assert result["name"] == "Tool: v2"
+            assert result["description"] == 'Use the "fast" mode'
+
+    def test_parse_frontmatter_keeps_trailing_inner_quote(self):
+        """An inner quote of the other kind at the end of a value survives."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_md = Path(tmp) / "SKILL.md"
+            skill_md.write_text(
+                "---\nname: \"Say 'hi'\"\ndescription: 'a \"b\"'\n---\nContent"
+            )
+
+            result = parse_skill_md(skill_md)
+
+            assert result["name"] == "Say 'hi'"
+            assert result["description"] == 'a "b"'
+            assert validate_skill_md(Path(tmp)) == []
+
     def test_parse_missing_frontmatter(self):
         """Return None values when frontmatter is missing."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -273,6 +808,17 @@ class TestParseSkillMd:
             assert result["name"] is None
             assert result["description"] is None
 
+    def test_parse_unclosed_frontmatter(self):
+        """Return None values when the closing --- is missing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_md = Path(tmp) / "SKILL.md"
+            skill_md.write_text("---\nname: Unclosed\ndescription: Test\n")
+
+            result = parse_skill_md(skill_md)
+
+            assert result["name"] is None
+            assert result["description"] is None
+
     def test_parse_partial_frontmatter(self):
         """Parse frontmatter with only some fields."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -284,6 +830,318 @@ class TestParseSkillMd:
             assert result["name"] == "Only Name"
             assert result["description"] is None
 
+    def test_parse_cache_sees_rewrites(self):
+        """Memoized results are per file version and safe to mutate."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_md = Path(tmp) / "SKILL.md"
+            skill_md.write_text("---\nname: First\n---\nContent")
+            parse_skill_md(skill_md)["name"] = "mutated"
+
+            assert parse_skill_md(skill_md)["name"] == "First"
+
+            skill_md.write_text("---\nname: Second version\n---\nContent")
+
+            assert parse_skill_md(skill_md)["name"] == "Second version"
+
+    def test_parse_ignores_nested_keys(self):
+        """Indented keys under another field aren't top-level fields."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_md = Path(tmp) / "SKILL.md"
+            skill_md.write_text(
+                "---\ndescription: Top\nmetadata:\n  name: nested\n---\nContent"
+            )
+
+            result = parse_skill_md(skill_md)
+
+            assert result["name"] is None
+            assert result["description"] == "Top"
+
+
+class TestInstallSkill:
+    """Tests for install_skill function."""
+
+    def _make_skill(self, root: Path) -> Path:
+        skill_dir = root / "src" / "my-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: Test\n---\nContent")
+        return skill_dir
+
+    def test_install_copies_by_default(self):
+        """The source directory is left untouched."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            target_dir.mkdir()
+
+            success, message = install_skill(skill_dir, target_dir)
+
+            assert success and message == "installed"
+            assert (target_dir / "my-skill" / "SKILL.md").exists()
+            assert (skill_dir / "SKILL.md").exists()
+
+    def test_install_move(self):
+        """With move=True the source is renamed into place."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            target_dir.mkdir()
+
+            success, _ = install_skill(skill_dir, target_dir, move=True)
+
+            assert success
+            assert (target_dir / "my-skill" / "SKILL.md").exists()
+            assert not skill_dir.exists()
+
+    def test_install_existing_requires_force(self):
+        """Existing skills are only replaced with force=True."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            (target_dir / "my-skill").mkdir(parents=True)
+            (target_dir / "my-skill" / "old.txt").write_text("old")
+
+            success, _ = install_skill(skill_dir, target_dir)
+            assert not success
+
+            success, message = install_skill(skill_dir, target_dir, force=True, move=True)
+            assert success and message == "updated"
+            assert not (target_dir / "my-skill" / "old.txt").exists()
+            assert (target_dir / "my-skill" / "SKILL.md").exists()
+            assert [p.name for p in target_dir.iterdir()] == ["my-skill"]
+
+    def test_install_replaces_stale_staging_dir(self):
+        """Leftovers from an interrupted install don't leak into the new one."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            (target_dir / ".my-skill.new").mkdir(parents=True)
+            (target_dir / ".my-skill.new" / "partial.txt").write_text("half-copied")
+
+            assert discover_skills(target_dir) == []
+
+            success, _ = install_skill(skill_dir, target_dir)
+
+            assert success
+            assert not (target_dir / "my-skill" / "partial.txt").exists()
+            assert [p.name for p in target_dir.iterdir()] == ["my-skill"]
+
+    def test_install_skip_unchanged(self):
+        """Reinstalling the same commit from the same repo is a no-op."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            target_dir.mkdir()
+            repo_info = {"url": "https://github.com/u/r", "clone_url": "https://github.com/u/r.git"}
+
+            install_skill(skill_dir, target_dir, repo_info=repo_info, commit_hash="abc1234")
+            (target_dir / "my-skill" / "local.txt").write_text("kept")
+
+            success, message = install_skill(
+                skill_dir, target_dir, repo_info=repo_info, commit_hash="abc1234",
+                skip_unchanged=True
+            )
+            assert success and message.startswith("unchanged")
+            assert (target_dir / "my-skill" / "local.txt").exists()
+
+            success, message = install_skill(
+                skill_dir, target_dir, repo_info=repo_info, commit_hash="def5678",
+                skip_unchanged=True
+            )
+            assert not success
+            assert (target_dir / "my-skill" / "local.txt").exists()
+
+            success, message = install_skill(
+                skill_dir, target_dir, repo_info=repo_info, commit_hash="def5678",
+                force=True, skip_unchanged=True
+            )
+            assert success and message == "updated"
+            assert not (target_dir / "my-skill" / "local.txt").exists()
+
+    def test_install_force_restores_modified_skill(self):
+        """force overwrites a locally edited skill even at the same commit."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            target_dir = Path(tmp) / "target"
+            target_dir.mkdir()
+            repo_info = {"url": "https://github.com/u/r", "clone_url": "https://github.com/u/r.git"}
+
+            install_skill(skill_dir, target_dir, repo_info=repo_info, commit_hash="abc1234")
+            (target_dir / "my-skill" / "SKILL.md").write_text("corrupted")
+
+            success, message = install_skill(
+                skill_dir, target_dir, repo_info=repo_info, commit_hash="abc1234",
+                force=True, skip_unchanged=True
+            )
+
+            assert success and message == "updated"
+            assert (target_dir / "my-skill" / "SKILL.md").read_text() == "---\nname: Test\n---\nContent"
+
+    def test_overwrite_symlinked_skill_keeps_target(self):
+        """Overwriting a symlinked skill replaces the link, not its target."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = self._make_skill(Path(tmp))
+            work_copy = Path(tmp) / "work" / "my-skill"
+            work_copy.mkdir(parents=True)
+            (work_copy / "SKILL.md").write_text("---\nname: Mine\n---\n")
+            target_dir = Path(tmp) / "target"
+            target_dir.mkdir()
+            (target_dir / "my-skill").symlink_to(work_copy)
+
+            assert [s["name"] for s in discover_skills(target_dir)] == ["Mine"]
+
+            success, _ = install_skill(skill_dir, target_dir, force=True)
+
+            assert success
+            assert not (target_dir / "my-skill").is_symlink()
+            assert (work_copy / "SKILL.md").exists()
+
+            remove_skill(target_dir / "my-skill")
+            assert not (target_dir / "my-skill").exists()
+
+
+class TestSkillMetadata:
+    """Tests for write_skill_metadata / read_skill_metadata."""
+
+    def test_metadata_round_trip(self):
+        """Written metadata can be read back."""
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_info = {"url": "https://github.com/u/r", "clone_url": "https://github.com/u/r.git",
+                         "branch": "main"}
+            write_skill_metadata(Path(tmp), repo_info, "abc1234")
+
+            metadata = read_skill_metadata(Path(tmp))
+
+            assert metadata["source_url"] == "https://github.com/u/r"
+            assert metadata["branch"] == "main"
+            assert metadata["commit"] == "abc1234"
+            assert metadata["installed_at"]
+
+            write_skill_metadata(Path(tmp), repo_info, "abc1234", installed_at="2024-01-02T03:04:05")
+
+            assert read_skill_metadata(Path(tmp))["installed_at"] == "2024-01-02T03:04:05"
+
+    def test_missing_or_corrupt_metadata(self):
+        """Missing or malformed metadata reads as None."""
+        with tempfile.TemporaryDirectory() as tmp:
+            assert read_skill_metadata(Path(tmp)) is None
+
+            (Path(tmp) / ".skills-cli.json").write_text("{not json")
+            assert read_skill_metadata(Path(tmp)) is None
+
+    def test_metadata_cache_sees_rewrites(self):
+        """Memoized metadata is re-read once the file changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp)
+            write_skill_metadata(skill_dir, {"url": "https://a", "branch": "main"})
+            first = read_skill_metadata(skill_dir)
+            first["branch"] = "mutated"
+
+            assert read_skill_metadata(skill_dir)["branch"] == "main"
+
+            write_skill_metadata(skill_dir, {"url": "https://a", "branch": "develop-branch"})
+
+            assert read_skill_metadata(skill_dir)["branch"] == "develop-branch"
+
+    def test_write_file_atomic_keeps_old_file_on_failure(self, monkeypatch):
+        """A failed write leaves the previous file and no temp file behind."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "manifest.json"
+            write_file_atomic(path, b"old")
+
+            def fail(src, dst):
+                raise OSError("disk full")
+
+            monkeypatch.setattr(os, "replace", fail)
+            with pytest.raises(OSError):
+                write_file_atomic(path, b"new")
+
+            assert path.read_bytes() == b"old"
+            assert [p.name for p in Path(tmp).iterdir()] == ["manifest.json"]
+
+
+class TestBackupSkill:
+    """Tests for backup_skill function."""
+
+    def test_backup_copies_contents_and_mode(self):
+        """Backups keep file contents and permission bits."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp) / "my-skill"
+            (skill_dir / "scripts").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text("---\nname: Test\n---\nContent")
+            script = skill_dir / "scripts" / "run.sh"
+            script.write_text("#!/bin/sh\necho hi\n")
+            script.chmod(0o755)
+
+            backup_path = backup_skill(skill_dir)
+
+            assert backup_path.parent == Path(tmp) / ".backup"
+            assert (backup_path / "SKILL.md").read_text() == (skill_dir / "SKILL.md").read_text()
+            assert (backup_path / "scripts" / "run.sh").stat().st_mode & 0o777 == 0o755
+
+    def test_backup_missing_skill(self):
+        """Nothing to back up for a missing directory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            assert backup_skill(Path(tmp) / "missing") is None
+
+
+class TestPackSkill:
+    """Tests for pack_skill function."""
+
+    def test_pack_skill(self):
+        """Pack all files under the skill folder, stored vs deflated by type."""
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp) / "my-skill"
+            (skill_dir / "assets").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text("---\nname: Test\n---\n" + "text " * 100)
+            (skill_dir / "assets" / "logo.png").write_bytes(b"\x89PNG" + b"\0" * 100)
+
+            zip_path = pack_skill(skill_dir, Path(tmp) / "dist")
+
+            assert zip_path == Path(tmp) / "dist" / "my-skill.zip"
+            with zipfile.ZipFile(zip_path) as zf:
+                infos = {info.filename: info for info in zf.infolist()}
+            assert set(infos) == {"my-skill/SKILL.md", "my-skill/assets/logo.png"}
+            assert infos["my-skill/SKILL.md"].compress_type == zipfile.ZIP_DEFLATED
+            assert infos["my-skill/assets/logo.png"].compress_type == zipfile.ZIP_STORED
+
+    def test_pack_skill_old_timestamps(self):
+        """Files with pre-1980 modification times can still be packed."""
+        import os
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp) / "my-skill"
+            skill_dir.mkdir()
+            skill_md = skill_dir / "SKILL.md"
+            skill_md.write_text("---\nname: Test\n---\nContent")
+            os.utime(skill_md, (0, 0))
+
+            zip_path = pack_skill(skill_dir, Path(tmp) / "dist")
+
+            with zipfile.ZipFile(zip_path) as zf:
+                assert zf.read("my-skill/SKILL.md").startswith(b"---")
+
+    def test_pack_skill_skips_special_files(self):
+        """Broken symlinks and FIFOs are left out instead of failing the pack."""
+        import os
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp) / "my-skill"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text("---\nname: Test\n---\nContent")
+            (skill_dir / "dangling").symlink_to(Path(tmp) / "missing")
+            os.mkfifo(skill_dir / "pipe")
+
+            zip_path = pack_skill(skill_dir, Path(tmp) / "dist")
+
+            with zipfile.ZipFile(zip_path) as zf:
+                assert zf.namelist() == ["my-skill/SKILL.md"]
+
 
 class TestValidateSkillMd:
     """Tests for validate_skill_md function."""
@@ -358,6 +1216,60 @@ class TestValidateSkillMd:
 
             assert any("name" in issue.lower() and "long" in issue.lower() for issue in issues)
 
+    def test_dashes_inside_value(self):
+        """A '---' inside a field value does not close the frontmatter."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp)
+            (skill_dir / "SKILL.md").write_text(
+                "---\nname: Test\ndescription: Before---after\n---\nContent"
+            )
+
+            assert validate_skill_md(skill_dir) == []
+
+    def test_crlf_line_endings(self):
+        """Frontmatter with Windows line endings is accepted."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp)
+            (skill_dir / "SKILL.md").write_bytes(
+                b"---\r\nname: Test\r\ndescription: Test\r\n---\r\nContent\r\n"
+            )
+
+            assert validate_skill_md(skill_dir) == []
+
+    def test_frontmatter_beyond_read_size(self):
+        """Frontmatter longer than the initial read falls back to the full file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp)
+            padding = "".join(f"key{i}: value\n" for i in range(1000))
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: Test\n{padding}description: Test\n---\nContent"
+            )
+
+            assert validate_skill_md(skill_dir) == []
+
+    def test_multiline_description(self):
+        """Folded block scalars are measured by their content, not the '>' marker."""
+        pytest.importorskip("yaml")
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp)
+            long_text = " ".join(["word"] * 120)
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: Test\ndescription: >\n  {long_text}\n---\nContent"
+            )
+
+            issues = validate_skill_md(skill_dir)
+
+            assert any("description" in issue.lower() and "long" in issue.lower() for issue in issues)
+
+    def test_validate_from_bytes(self):
+        """Content already read from disk validates like the file itself."""
+        assert validate_skill_md_from_bytes(b"---\nname: A\ndescription: B\n---\nBody") == []
+
+        issues = validate_skill_md_from_bytes(b"---\nname: A\n---\n")
+
+        assert any("description" in issue.lower() for issue in issues)
+        assert any("empty" in issue.lower() for issue in issues)
+
 
 if __name__ == "__main__":
     import pytest